@@ -5,7 +5,6 @@
 # * tabula-py Documentation: https://tabula-py.readthedocs.io/en/latest/tabula.html#tabula.io.convert_into
 import tabula, csv  # For PDF parsing to CSV
 import PyPDF2, pdfplumber  # For finding the right page number and page locations to point Tabula to
-import locale  # For using C-style atoi() function
 import json  # For printing the Dictionary as Structured JSON
 import re  # For regexing the TIF ID number from URL
 import requests  # For getting an HTML Response to parse with BeautifulSoup
@@ -13,22 +12,43 @@ import sys, os, io  # For arg parsing and filepath management
 import time  # For reporting program runtime
 import pandas as pd  # For data cleaning
 import traceback  # For printing stack traces upon failure
+import hashlib  # For content-addressing cached PDFs
+import argparse  # For command line options
+import tempfile  # For handing tabula one on-disk copy of each PDF
+import bisect  # For bucketing words into table columns by x coordinate
 import multiprocessing, concurrent.futures  # For threading
+import threading, queue  # For the bounded queues between Pipeline stages
+import contextlib  # For holding one journal file open per year during a backfill
 import logging
 import string # for string.capwords() to correct bank names
 # For Debugging: import tabula, csv, PyPDF2, pdfplumber, locale, json, re, requests, sys, os, io, time, pandas as pd, traceback, multiprocessing, concurrent.futures
 from bs4 import BeautifulSoup  # For HTML parsing the DAR URLs
 from math import isnan  # For checking if parsed values are NaN or not
 from urllib.parse import urljoin  # For joining URLs in Tools.darYearsUrls()
+from html import unescape  # For decoding entities in hrefs scanned from raw HTML
+from collections import namedtuple  # For lightweight records passed between parsing steps
+from requests.adapters import HTTPAdapter  # For sizing the keep-alive connection pool of the downloader
+from operator import methodcaller  # For picklable Pipeline stage callables that invoke a DAR step
+from functools import partial  # For picklable Pipeline stage callables that run a DAR step in a pool worker
+from difflib import get_close_matches  # For fuzzy matching of table row labels
 
 class Tools:
     """A collection of utility functions for TIF data parsing and processing."""
 
+    # The webpage linking to each year's DAR webpage
+    DAR_YEARS_URL = 'https://www.chicago.gov/city/en/depts/dcd/supp_info/tif-district-annual-reports-2004-present.html'
+    # The value of every href attribute in a webpage
+    HREF_PATTERN = re.compile(r"""href\s*=\s*["']([^"']*)["']""", re.IGNORECASE)
+    # Report URLs linked from a year's webpage that are never parsed: (URL, with {yr} for the 2 digit year, first report year it applies to)
+    URL_BLOCKLIST = [
+        # ! - Added in 2024, preserved in 2025 (23 report, 24 report) - href exists for this PDF but the URL is invalid, and is not visible on the webpage itself
+        ('https://www.chicago.gov/content/dam/city/depts/dcd/tif/{yr}reports/T_067_ArcherCourtsAR{yr}.pdf', 2023),
+    ]
+
     def stof(toClean):
-        """Converts a string to a float."""
-        locale.setlocale(locale.LC_NUMERIC, 'en_US.UTF-8')
+        """Converts a string to a float. Locale-free (commas are thousands separators), so it is thread-safe."""
         if isinstance(toClean, str):
-            # Remove stray dollar signs and/or asterisks to prepare for locale.atof() parsing
+            # Remove stray dollar signs and/or asterisks to prepare for float() parsing
             toClean = toClean.replace('$', '').replace('*', '').replace(' ', '').strip()
             # toClean is a String
             if '-' in toClean and len(toClean) <= 1:
@@ -43,10 +63,10 @@ class Tools:
             try:
                 if match:
                     # Number is negative, so we update the Float return value appropriately
-                    return -1 * locale.atof(match.group(1))
+                    return -1 * float(match.group(1).replace(',', ''))
                 else:
                     # Number is positive, so return the cleaned string as a Float
-                    return locale.atof(toClean)
+                    return float(toClean.replace(',', ''))
             except ValueError as e:
                 print(f"Caught: {e}")
                 print(len(toClean))
@@ -60,10 +80,19 @@ class Tools:
                 sys.exit(1)
         # Return None if the value cannot be determined
         return None
+
+    def sumMoney(values):
+        """Sums a Series of money strings with Tools.stof(), skipping unparseable values; an empty Series sums to 0."""
+        if len(values) == 0:
+            return 0
+        return values.apply(Tools.stof).sum()
         
     def darYearsUrls():
         """Parses the chicago.gov 'TIF District Annual Reports 1997-present' webpage; returns a Dictionary with Years matched to URLs"""
-        html = requests.get('https://www.chicago.gov/city/en/depts/dcd/supp_info/tif-district-annual-reports-2004-present.html').text
+        return Tools.parseDarYearsUrls(requests.get(Tools.DAR_YEARS_URL).text)
+
+    def parseDarYearsUrls(html):
+        """Returns the Dictionary of Years matched to URLs from the HTML of the DAR_YEARS_URL webpage."""
         soup = BeautifulSoup(html, "html.parser")
         year_links = soup.find_all("a", href=True)
         darYearsUrls = {}
@@ -82,48 +111,45 @@ class Tools:
 
     def urlList(url, year):
         """Obtains a list of TIF DAR URLs using BeautifulSoup."""
+        # Load TIF reports URL for a specific year
+        r = requests.get(url)
+        return Tools.parseUrlList(r.text, year)
+
+    def parseUrlList(html, year, blocklist=None):
+        """Returns the list of TIF DAR URLs from the HTML of one year's webpage."""
+        return list(Tools.iterUrls(html, year, blocklist))
+
+    def iterUrls(html, year, blocklist=None):
+        """Yields each TIF DAR URL linked from one year's webpage once, in webpage order, skipping blocklisted URLs.
 
+        blocklist defaults to Tools.URL_BLOCKLIST; pass [] to keep every URL.
+        """
         # Obtain a 2 digit year
         yr = str(year)[-2:]
-        # Load TIF reports URL for a specific year
-        r = requests.get(url)
-        # Parses through HTML
-        soup = BeautifulSoup(r.text, "html.parser")
-        #links = soup.find_all(href=True) #contains hyperlink
-        # Return a List of PDF links
-        pdf_links = ["https://www.chicago.gov" + link['href'] for link in soup.find_all(href=lambda href: href and href.endswith(f'AR{yr}.pdf'))]
-        # Remove any duplicates
-        outList = []
-        [outList.append(url) for url in pdf_links if url not in outList]
-        # ! - Added in 2024, preserved in 2025 (23 report, 24 report) - href exists for this PDF but the URL is invalid, and is not visible on the webpage itself
-        archerCourtsUrlToRemove = f'https://www.chicago.gov/content/dam/city/depts/dcd/tif/{yr}reports/T_067_ArcherCourtsAR{yr}.pdf'
-        if archerCourtsUrlToRemove in outList and int(year) > 2022:  
-            outList.remove(archerCourtsUrlToRemove)
-        return outList
+        blocked = {
+            url.format(yr=yr) for url, firstYear in (Tools.URL_BLOCKLIST if blocklist is None else blocklist)
+            if int(year) >= firstYear
+        }
+        seen = set()
+        # Scan the raw HTML for href values; only the PDF links are needed, so no parse tree is built
+        for match in Tools.HREF_PATTERN.finditer(html):
+            href = match.group(1)
+            if not href.endswith(f'AR{yr}.pdf'):
+                continue
+            url = "https://www.chicago.gov" + unescape(href)
+            if url not in seen and url not in blocked:
+                seen.add(url)
+                yield url
 
     def getPageNumFromText(pdf, target_text):
         """Get the page number containing the specified text in a PDF document; return an int or None."""   
-
-        # Read the PDF bytes into PyPDF2
-        reader = PyPDF2.PdfReader(pdf)
-        # Iterate each page and search for the target_text
-        num_pages = len(reader.pages)
-        for page_num in range(num_pages):
-            page = reader.pages[page_num]
-            page_text = page.extract_text()
-            if target_text in page_text:
-                return page_num + 1  # Add 1 to convert from 0-indexed to 1-indexed page number
-        # Return None if the target text is not found in any page
-        return None
+        # For more than one lookup on the same PDF, build a PageIndex once and reuse it instead
+        return PageIndex(pdf).find(target_text)
 
     def getTextCoords(pdf, page, target_text):
-        with pdfplumber.open(pdf) as pdf:
-            page = pdf.pages[page-1] 
-            for word in page.extract_words():
-                if re.search(target_text, word["text"]):
-                    # print(word)
-                    return word
-        return None  # Target text not found
+        # For more than one lookup on the same PDF, use a PdfLayout to avoid re-parsing it
+        with PdfLayout(pdf) as layout:
+            return layout.findWord(page, target_text)
 
     def fixHeader_termTable(df, searchstr):
         """Eliminated the extraneous rows on the top by finding the first TIF"""
@@ -199,49 +225,767 @@ class Tools:
         return combined_df
         
 
+class PageIndex:
+    """Extracts each page's text from a PDF at most once and answers any number of marker lookups from memory."""
+
+    def __init__(self, pdf):
+        # Read the PDF bytes into PyPDF2 a single time
+        self.reader = PyPDF2.PdfReader(pdf)
+        self.numPages = len(self.reader.pages)
+        self.pageTexts = []  # Page text in page order, filled lazily as lookups scan forward
+
+    def pageText(self, pageIdx):
+        """Returns the text of a 0-indexed page, extracting any pages up to it that have not been read yet."""
+        while len(self.pageTexts) <= pageIdx:
+            self.pageTexts.append(self.reader.pages[len(self.pageTexts)].extract_text() or '')
+        return self.pageTexts[pageIdx]
+
+    def find(self, target_text):
+        """Returns the 1-indexed page number of the first page containing target_text, or None."""
+        return self.findAll([target_text])[target_text]
+
+    def findAll(self, targets):
+        """Locates every target in one forward pass; returns a Dictionary of target -> 1-indexed page number or None."""
+        found = {target: None for target in targets}
+        remaining = set(targets)
+        for pageIdx in range(self.numPages):
+            if not remaining:
+                break  # Every marker located, so later pages are never extracted
+            text = self.pageText(pageIdx)
+            for target in [t for t in remaining if t in text]:
+                found[target] = pageIdx + 1  # Add 1 to convert from 0-indexed to 1-indexed page number
+                remaining.discard(target)
+        return found
+
+
+class PdfLayout:
+    """One pdfplumber document per PDF that keeps each page's word boxes for repeated coordinate lookups."""
+
+    # An amount as printed after a '$': digits with separators, optionally in parentheses, or a '-' for zero
+    AMOUNT_PATTERN = re.compile(r'^(-|\(?[\d,.]+\)?)$')
+
+    def __init__(self, pdf):
+        self.doc = pdfplumber.open(pdf)
+        self.pageWords = {}  # 1-indexed page number -> list of pdfplumber word Dictionaries
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.doc.close()
+
+    def words(self, page):
+        """Returns the word boxes of a 1-indexed page, running the layout analysis only on first use."""
+        if page not in self.pageWords:
+            self.pageWords[page] = self.doc.pages[page-1].extract_words()
+        return self.pageWords[page]
+
+    def findWords(self, page, target_text):
+        """Returns every word on a 1-indexed page whose text matches the target_text regex."""
+        pattern = re.compile(target_text)
+        return [word for word in self.words(page) if pattern.search(word["text"])]
+
+    def findWord(self, page, target_text):
+        """Returns the first word on a 1-indexed page matching the target_text regex, or None."""
+        pattern = re.compile(target_text)
+        for word in self.words(page):
+            if pattern.search(word["text"]):
+                return word
+        return None  # Target text not found
+
+    def extractTable(self, page, area, columns, rowOverlap=1):
+        """Builds a tabula-style stream table from word boxes, without Java; returns a DataFrame with no header.
+
+        area is [topY, leftX, bottomY, rightX] and columns are x boundaries, as passed to tabula.read_pdf.
+        Words whose vertical extents overlap form a row; each word lands in the first column whose boundary
+        is at or right of its left edge. Amounts are the exception: a right-aligned amount (or the '-' marking
+        a zero) can start past the boundary of its own column, so it joins the cell of the '$' before it.
+        """
+        top, left, bottom, right = area
+        words = [
+            word for word in self.words(page)
+            if top <= (word['top'] + word['bottom']) / 2 <= bottom and left <= (word['x0'] + word['x1']) / 2 <= right
+        ]
+        # Group words into rows by vertical overlap
+        rows = []
+        for word in sorted(words, key=lambda w: (w['top'], w['x0'])):
+            if rows and word['top'] < rows[-1]['bottom'] - rowOverlap:
+                rows[-1]['words'].append(word)
+                rows[-1]['bottom'] = max(rows[-1]['bottom'], word['bottom'])
+            else:
+                rows.append({'bottom': word['bottom'], 'words': [word]})
+        # Bucket each row's words into cells by the column boundaries, keeping each amount with its '$'
+        data = []
+        for row in rows:
+            cells = [[] for _ in range(len(columns) + 1)]
+            dollarCell = None  # Cell of a '$' still waiting for its amount
+            for word in sorted(row['words'], key=lambda w: w['x0']):
+                if dollarCell is not None and PdfLayout.AMOUNT_PATTERN.match(word['text']):
+                    cell = dollarCell
+                else:
+                    cell = bisect.bisect_left(columns, word['x0'])
+                dollarCell = cell if word['text'] == '$' else None
+                cells[cell].append(word['text'])
+            data.append([' '.join(cell) if cell else float('nan') for cell in cells])
+        return pd.DataFrame(data)
+
+
+# One tabula extraction: key maps the result back to the parsing step that requested it
+TableRequest = namedtuple(
+    'TableRequest',
+    ['key', 'pages', 'area', 'columns', 'lattice', 'stream', 'pandas_options', 'silent'],
+    defaults=[None, None, False, False, None, None]
+)
+
+
+class TabulaExtractor:
+    """Runs every TableRequest for a PDF (or a batch of PDFs) together against tabula-py's in-process JVM.
+
+    tabula-py >= 2.8 starts its JVM through jpype once per Python process and keeps it, so collecting all of
+    a DAR's extractions here means they share one JVM instead of spawning a Java process per read_pdf call.
+    The 'subprocess' backend keeps the old one-java-process-per-call behavior for environments without jpype.
+    """
+
+    BACKENDS = ('jpype', 'subprocess')
+
+    # tabula-py's isJVMStarted()/startJVM() check is not thread-safe, so the first jpype read in a process holds
+    # this lock (e.g. Backfill extracting each year's Term Table on its own thread); later reads run concurrently
+    jvmLock = threading.Lock()
+    jvmStarted = False
+
+    def __init__(self, backend='jpype'):
+        if backend not in TabulaExtractor.BACKENDS:
+            raise ValueError(f"Unknown tabula backend '{backend}'; expected one of {TabulaExtractor.BACKENDS}")
+        self.backend = backend
+
+    def warm(self, pdf):
+        """Boots the JVM and loads tabula-java with a tiny extraction, so the first real report does not pay for it."""
+        if self.backend != 'jpype':
+            return  # Every subprocess call starts a fresh JVM, so there is nothing to keep warm
+        try:
+            self.run(pdf, [TableRequest('warmup', pages=1, area=[0, 0, 50, 50], silent=True)])
+        except Exception as e:
+            print(f"TabulaExtractor warm-up failed (the JVM will start on first use): {e}")
+
+    def run(self, pdf, tableRequests):
+        """Extracts every request from one PDF (a path or file-like object); returns a Dictionary of key -> list of DataFrames."""
+        return self.runBatch([(pdf, tableRequests)])[0]
+
+    def runBatch(self, jobs):
+        """Extracts a list of (pdf, tableRequests) jobs in one pass; returns one result Dictionary per job, in order."""
+        results = []
+        for pdf, tableRequests in jobs:
+            path, isTemp = self._localize(pdf)
+            try:
+                results.append({request.key: self._read(path, request) for request in tableRequests})
+            finally:
+                if isTemp:
+                    os.unlink(path)
+        return results
+
+    def _localize(self, pdf):
+        """Writes in-memory PDF bytes to disk once, so tabula does not re-copy them for every request."""
+        if isinstance(pdf, str):
+            return pdf, False
+        pdf.seek(0)
+        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
+            f.write(pdf.read())
+        pdf.seek(0)
+        return f.name, True
+
+    def _read(self, path, request):
+        if self.backend == 'jpype' and not TabulaExtractor.jvmStarted:
+            with TabulaExtractor.jvmLock:
+                if not TabulaExtractor.jvmStarted:
+                    tables = self._readPdf(path, request)
+                    TabulaExtractor.jvmStarted = True
+                    return tables
+        return self._readPdf(path, request)
+
+    def _readPdf(self, path, request):
+        return tabula.read_pdf(
+            input_path=path,
+            pages=request.pages,
+            area=request.area,
+            columns=request.columns,
+            lattice=request.lattice,
+            stream=request.stream,
+            pandas_options=request.pandas_options,
+            silent=request.silent,
+            force_subprocess=(self.backend == 'subprocess'),
+        )
+
+
+class LabelMatcher:
+    """Compiles a set of table row labels once, then finds all of them in a table's label column with a single scan.
+
+    A row matches a label exactly (after normalizing case, whitespace and '*'/':'), else by starting with the
+    label; labels still missing after the scan fall back to fuzzy matching against the rows that were seen and
+    not already claimed by another label. Sibling labels such as 'Transfers from Municipal Sources' and
+    'Transfers to Municipal Sources' score ~0.93 against each other, so the cutoff must stay well above that.
+    """
+
+    def __init__(self, labels, fuzzyCutoff=0.97):
+        self.labels = list(dict.fromkeys(labels))
+        self.normalized = {LabelMatcher.normalize(label): label for label in self.labels}
+        self.fuzzyCutoff = fuzzyCutoff
+
+    def normalize(text):
+        """Lowercases, drops '*' and trailing ':' and collapses whitespace."""
+        return re.sub(r'\s+', ' ', str(text).replace('*', '')).strip().rstrip(':').strip().lower()
+
+    def index(self, labelColumn, fuzzyHits=None):
+        """Returns a Dictionary of label -> 0-indexed row position for every label found in labelColumn.
+
+        Each fuzzy match is also recorded in fuzzyHits (label -> matched row text), when a Dictionary is given.
+        """
+        found = {} # label -> (rank, position); rank 0 is an exact match, 1 a prefix match
+        seen = {} # normalized row text -> first position, for the fuzzy fallback
+        for pos, text in enumerate(labelColumn.tolist()):
+            if not isinstance(text, str):
+                continue
+            norm = LabelMatcher.normalize(text)
+            seen.setdefault(norm, pos)
+            label = self.normalized.get(norm)
+            if label is not None:
+                if label not in found or found[label][0] > 0:
+                    found[label] = (0, pos) # First exact match wins, even over an earlier prefix match
+                continue
+            for labelNorm, label in self.normalized.items():
+                if label not in found and norm.startswith(labelNorm):
+                    found[label] = (1, pos)
+        rows = {label: pos for label, (_, pos) in found.items()}
+        for labelNorm, label in self.normalized.items():
+            if label not in rows:
+                # A row another label already claimed is never a candidate (e.g. a missing 'to' row must not take the 'from' row)
+                claimed = set(rows.values())
+                candidates = [norm for norm, pos in seen.items() if pos not in claimed]
+                match = get_close_matches(labelNorm, candidates, n=1, cutoff=self.fuzzyCutoff)
+                if match:
+                    rows[label] = seen[match[0]]
+                    if fuzzyHits is not None:
+                        fuzzyHits[label] = match[0]
+        return rows
+
+
+class TermTable:
+    """The Section 1 Term Table preparsed into a TIF name -> (start_year, end_year) Dictionary.
+
+    Built once per year; names are normalized like LabelMatcher row labels, so a lookup is one hash probe.
+    Names that are not found are collected for missReport().
+    """
+
+    def __init__(self, df):
+        # Set Column Names
+        nameCol = df.filter(like='Name of Redevelopment Project Area').columns.tolist()[0]
+        desigCol = df.filter(like='Date Designated').columns.tolist()[0]
+        termCol = df.filter(like='Date Terminated').columns.tolist()[0]
+        self.years = {}
+        for name, designated, terminated in zip(df[nameCol].tolist(), df[desigCol].tolist(), df[termCol].tolist()):
+            if isinstance(name, str):
+                # The first row for a name wins, as the old boolean mask's .values[0] did
+                self.years.setdefault(LabelMatcher.normalize(name), (TermTable.year(designated), TermTable.year(terminated)))
+        self.misses = [] # (tif_name, url, closest Term Table name or None)
+
+    def year(date):
+        """Returns the 4-digit year of an 'MM/DD/YYYY' date as a String, or -1 when there is none."""
+        match = re.search(r'(\d{4})\s*$', str(date))
+        return match.group(1) if match else -1
+
+    def lookup(self, tifName, url=None):
+        """Returns (start_year, end_year) for tifName, or (-1, -1) after recording the miss."""
+        years = self.years.get(LabelMatcher.normalize(tifName))
+        if years is None:
+            match = get_close_matches(LabelMatcher.normalize(tifName), list(self.years), n=1, cutoff=0.8)
+            self.misses.append((tifName, url, match[0] if match else None))
+            return -1, -1
+        return years
+
+    def missReport(self):
+        """Prints every TIF name that was not in the Term Table, with the closest name when there is one."""
+        if not self.misses:
+            return
+        print(f"WARNING: {len(self.misses)} TIF name(s) not found in the Term Table; start_year/end_year left as -1:")
+        for tifName, url, closest in self.misses:
+            print(f"  {tifName!r} ({url})" + (f" - closest Term Table name: {closest!r}" if closest else ''))
+
+
+class UrlIndex:
+    """A persisted index of the chicago.gov DAR webpages: year -> year webpage URL, and year webpage -> PDF URLs.
+
+    Each webpage is kept parsed (never as HTML) in one JSON file, with the ETag/Last-Modified headers it came with.
+    A webpage fetched within maxAge is served from the index; an older one is revalidated with a conditional GET
+    and parsed again only if the server sends a new copy.
+    """
+
+    DEFAULT_FP = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'url_index.json')
+
+    def __init__(self, indexFp=DEFAULT_FP, maxAge=24 * 60 * 60, offline=False, concurrency=8):
+        self.indexFp = indexFp
+        self.maxAge = maxAge  # Seconds a webpage is served without revalidating against the server
+        self.offline = offline  # Serve only from the index, never touch the network
+        self.concurrency = concurrency  # Year webpages fetched at once by allReports()
+        self.lock = threading.Lock()  # Year webpages may be looked up from several threads
+        self.session = None  # Shared keep-alive Session, created on first use
+        try:
+            with open(indexFp, 'r') as f:
+                self.pages = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.pages = {}
+
+    def _save(self):
+        """Writes the index to a temp file and renames it into place so readers never see a partial file."""
+        tmpPath = f'{self.indexFp}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmpPath, 'w') as f:
+            json.dump(self.pages, f)
+        os.replace(tmpPath, self.indexFp)
+
+    def _session(self):
+        with self.lock:
+            if self.session is None:
+                self.session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=self.concurrency, pool_maxsize=self.concurrency)
+                self.session.mount('https://', adapter)
+                self.session.mount('http://', adapter)
+            return self.session
+
+    def _page(self, url, parse):
+        """Returns parse(html) of the webpage at url, fetching or revalidating it only when needed."""
+        with self.lock:
+            entry = self.pages.get(url)
+        if entry is not None:
+            if self.offline or time.time() - entry['fetched'] < self.maxAge:
+                return entry['data']
+        elif self.offline:
+            raise LookupError(f'Offline mode: {url} is not in the URL index at {self.indexFp}')
+
+        # Revalidate with a conditional GET when the webpage is already indexed
+        headers = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        try:
+            r = self._session().get(url, headers=headers)
+            if r.status_code == 304 and entry is not None:
+                entry = dict(entry, fetched=time.time())
+            else:
+                r.raise_for_status()
+                entry = {'data': parse(r.text), 'etag': r.headers.get('ETag'),
+                         'last_modified': r.headers.get('Last-Modified'), 'fetched': time.time()}
+        except requests.RequestException as e:
+            if entry is None:
+                raise
+            print(f"WARNING: unable to revalidate {url} ({type(e).__name__}: {e}); using the indexed copy")
+            return entry['data']
+        with self.lock:
+            self.pages[url] = entry
+            self._save()
+        return entry['data']
+
+    def darYearsUrls(self):
+        """Tools.darYearsUrls(), served from the index."""
+        return self._page(Tools.DAR_YEARS_URL, Tools.parseDarYearsUrls)
+
+    def urlList(self, url, year):
+        """Tools.urlList(), served from the index."""
+        return self._page(url, partial(Tools.parseUrlList, year=year))
+
+    def reports(self, year):
+        """Returns [(tif_number, PDF URL)] for one year, with the zero-padded TIF number from each filename."""
+        reports = []
+        for pdfUrl in self.urlList(self.darYearsUrls()[str(year)], year):
+            match = re.search(r'T_(\d+)_', pdfUrl.split('/')[-1])
+            if match:
+                reports.append((match.group(1), pdfUrl))
+        return reports
+
+    def allReports(self, years=None):
+        """Returns {year: reports(year)} for the given years (default: every year), fetching the year webpages concurrently."""
+        years = list(self.darYearsUrls()) if years is None else [str(year) for year in years]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            return dict(zip(years, executor.map(self.reports, years)))
+
+
+class PdfCache:
+    """A persistent, content-addressed on-disk cache of downloaded DAR PDFs.
+
+    PDF bytes are stored once under blobs/<sha256 of content>.pdf; each URL has a small JSON
+    record under meta/<sha256 of URL>.json pointing at its blob along with the ETag/Last-Modified
+    headers used for revalidation. The mtime of a URL's meta file is its last access time (LRU).
+    """
+
+    def __init__(self, cacheDir, maxBytes=2 * 1024**3, maxAge=7 * 24 * 60 * 60, offline=False):
+        self.cacheDir = cacheDir
+        self.blobDir = os.path.join(cacheDir, 'blobs')
+        self.metaDir = os.path.join(cacheDir, 'meta')
+        self.maxBytes = maxBytes  # Total blob size allowed before LRU eviction
+        self.maxAge = maxAge  # Seconds an entry is served without revalidating against the server
+        self.offline = offline  # Serve only from the cache, never touch the network
+        os.makedirs(self.blobDir, exist_ok=True)
+        os.makedirs(self.metaDir, exist_ok=True)
+
+    def _metaPath(self, url):
+        return os.path.join(self.metaDir, hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json')
+
+    def _blobPath(self, digest):
+        return os.path.join(self.blobDir, digest + '.pdf')
+
+    def _writeAtomic(self, path, data):
+        """Writes bytes to a temp file and renames it into place so readers never see partial files."""
+        tmpPath = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmpPath, 'wb') as f:
+            f.write(data)
+        os.replace(tmpPath, path)
+
+    def _readMeta(self, url):
+        """Returns the meta Dictionary for a URL, or None if the URL (or its blob) is not cached."""
+        try:
+            with open(self._metaPath(url), 'r') as f:
+                meta = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        if not os.path.exists(self._blobPath(meta['sha256'])):
+            return None
+        return meta
+
+    def _readBlob(self, url, meta):
+        with open(self._blobPath(meta['sha256']), 'rb') as f:
+            content = f.read()
+        os.utime(self._metaPath(url))  # Mark as recently used
+        return content
+
+    def path(self, url):
+        """Returns the on-disk path of a cached URL's PDF, or None if it is not cached."""
+        meta = self._readMeta(url)
+        return self._blobPath(meta['sha256']) if meta else None
+
+    def get(self, url, session=None):
+        """Returns the PDF bytes for url, downloading or revalidating only when needed."""
+        meta = self._readMeta(url)
+        if meta is not None:
+            if self.offline or time.time() - meta['fetched'] < self.maxAge:
+                return self._readBlob(url, meta)
+        elif self.offline:
+            raise LookupError(f'Offline mode: {url} is not in the PDF cache at {self.cacheDir}')
+
+        # Revalidate with a conditional GET when we already hold a copy
+        headers = {}
+        if meta is not None:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        r = (session or requests).get(url, headers=headers)
+        if r.status_code == 304 and meta is not None:
+            meta['fetched'] = time.time()
+            self._writeAtomic(self._metaPath(url), json.dumps(meta).encode('utf-8'))
+            return self._readBlob(url, meta)
+        r.raise_for_status()
+        return self.put(url, r.content, r.headers.get('ETag'), r.headers.get('Last-Modified'))
+
+    def _readMetas(self):
+        """Returns (mtime, metaPath, meta) for every readable meta file."""
+        entries = []
+        for name in os.listdir(self.metaDir):
+            if not name.endswith('.json'):
+                continue
+            metaPath = os.path.join(self.metaDir, name)
+            try:
+                with open(metaPath, 'r') as f:
+                    meta = json.load(f)
+                entries.append((os.path.getmtime(metaPath), metaPath, meta))
+            except (FileNotFoundError, ValueError):
+                continue
+        return entries
+
+    def _removeBlob(self, digest):
+        try:
+            os.remove(self._blobPath(digest))
+        except FileNotFoundError:
+            pass
+
+    def put(self, url, content, etag=None, lastModified=None):
+        """Stores downloaded bytes for url; identical PDFs share one blob. Returns content."""
+        digest = hashlib.sha256(content).hexdigest()
+        # Remember the blob this URL pointed at before, in case the PDF changed
+        try:
+            with open(self._metaPath(url), 'r') as f:
+                oldDigest = json.load(f)['sha256']
+        except (FileNotFoundError, ValueError, KeyError):
+            oldDigest = None
+        if not os.path.exists(self._blobPath(digest)):
+            self._writeAtomic(self._blobPath(digest), content)
+        meta = {
+            'url': url,
+            'sha256': digest,
+            'size': len(content),
+            'etag': etag,
+            'last_modified': lastModified,
+            'fetched': time.time(),
+        }
+        self._writeAtomic(self._metaPath(url), json.dumps(meta).encode('utf-8'))
+        # Drop the old blob once no URL points at it anymore
+        if oldDigest and oldDigest != digest and all(m['sha256'] != oldDigest for _, _, m in self._readMetas()):
+            self._removeBlob(oldDigest)
+        return content
+
+    def evict(self):
+        """Removes unreferenced blobs, then least recently used entries until the blobs fit within maxBytes."""
+        entries = self._readMetas()
+        # Blob sizes are counted once even when several URLs point at the same content
+        blobSizes = {meta['sha256']: meta['size'] for _, _, meta in entries}
+        # Blobs no meta file points at (e.g. left behind by an interrupted put) can never be served
+        for name in os.listdir(self.blobDir):
+            if name.endswith('.pdf') and name[:-len('.pdf')] not in blobSizes:
+                self._removeBlob(name[:-len('.pdf')])
+        refCounts = {}
+        for _, _, meta in entries:
+            refCounts[meta['sha256']] = refCounts.get(meta['sha256'], 0) + 1
+        totalBytes = sum(blobSizes.values())
+        for _, metaPath, meta in sorted(entries, key=lambda e: e[0]):
+            if totalBytes <= self.maxBytes:
+                break
+            os.remove(metaPath)
+            refCounts[meta['sha256']] -= 1
+            if refCounts[meta['sha256']] == 0:
+                self._removeBlob(meta['sha256'])
+                totalBytes -= blobSizes[meta['sha256']]
+
+
+class PdfDownloader:
+    """Downloads PDFs into a PdfCache for the Pipeline's download stage threads.
+
+    Transient failures are retried with exponential backoff. Every thread shares one Session, whose connection
+    pool (sized to the stage's concurrency) keeps connections to www.chicago.gov alive between PDFs.
+    """
+
+    def __init__(self, cache, concurrency=8, retries=3, backoff=1.0):
+        self.cache = cache
+        self.concurrency = concurrency
+        self.retries = retries # Extra attempts after the first for connection errors and 5xx responses
+        self.backoff = backoff # Seconds before the first retry; doubles on each retry
+        self.session = self._newSession() # Shared keep-alive Session for every download thread
+
+    def _newSession(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.concurrency, pool_maxsize=self.concurrency)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _shouldRetry(self, e, attempt):
+        """Client errors (e.g. a 404 for a dead link) will not fix themselves, so only transient failures are retried."""
+        response = getattr(e, 'response', None)
+        return attempt < self.retries and (response is None or response.status_code >= 500)
+
+    def fetch(self, url):
+        """Fetches one URL through the cache from a blocking caller (e.g. a Pipeline thread); raises once retries are exhausted."""
+        for attempt in range(self.retries + 1):
+            try:
+                return self.cache.get(url, self.session)
+            except requests.RequestException as e:
+                if not self._shouldRetry(e, attempt):
+                    raise
+            time.sleep(self.backoff * 2 ** attempt)
+
+
+class Stage:
+    """One step of a Pipeline: a callable applied to each item by the stage's own pool of workers.
+
+    kind='thread' runs func on the stage's dispatcher threads (for I/O or light work); kind='process' runs it in
+    a spawned process pool of the same size (for CPU-bound work), so func and items must be picklable.
+    """
+
+    def __init__(self, name, func, workers=1, kind='thread', initializer=None, initargs=()):
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.kind = kind
+        self.initializer = initializer # Process stages only: runs once in each worker process
+        self.initargs = initargs
+        self.lock = threading.Lock()
+        self.resetStats()
+
+    def resetStats(self):
+        """Clears the throughput and queue depth statistics."""
+        self.count = 0
+        self.busy = 0.0
+        self.firstStart = None
+        self.lastEnd = None
+        self.depthSamples = 0
+        self.depthTotal = 0
+        self.maxDepth = 0
+
+    def record(self, start, end):
+        with self.lock:
+            self.count += 1
+            self.busy += end - start
+            self.firstStart = start if self.firstStart is None else min(self.firstStart, start)
+            self.lastEnd = end if self.lastEnd is None else max(self.lastEnd, end)
+
+    def sampleDepth(self, depth):
+        with self.lock:
+            self.depthSamples += 1
+            self.depthTotal += depth
+            self.maxDepth = max(self.maxDepth, depth)
+
+    def summary(self):
+        """Returns a one-line report of this stage's throughput and input queue depth."""
+        elapsed = (self.lastEnd - self.firstStart) if self.count else 0
+        rate = self.count / elapsed if elapsed > 0 else 0
+        avgBusy = self.busy / self.count if self.count else 0
+        avgDepth = self.depthTotal / self.depthSamples if self.depthSamples else 0
+        return (f"{self.name:<10} {self.workers:>2} workers | {self.count:>4} items | {rate:6.2f} items/s | "
+                f"{avgBusy:6.2f}s/item | queue avg {avgDepth:4.1f} max {self.maxDepth}")
+
+
+class Pipeline:
+    """Runs items through a list of Stages connected by bounded queues, so the stages' work overlaps.
+
+    A full queue blocks the stage feeding it, which keeps a fast stage (e.g. downloads) from racing ahead of a
+    slow one. An item whose stage raises skips the remaining stages and comes out with the error attached.
+    """
+
+    _DONE = object() # End-of-input marker passed down the queues
+
+    def __init__(self, stages, queueSize=8, reportInterval=10):
+        self.stages = stages
+        self.queueSize = queueSize
+        self.reportInterval = reportInterval # Seconds between progress lines while waiting on results
+        self.cancelled = threading.Event()
+
+    def run(self, items):
+        """Feeds items through every stage; yields (item, error) pairs in completion order, error being (stageName, exception) or None."""
+        self.cancelled.clear()
+        for stage in self.stages:
+            stage.resetStats()
+        # One bounded input queue per stage, plus an unbounded output queue
+        self.queues = [queue.Queue(maxsize=self.queueSize) for _ in self.stages] + [queue.Queue()]
+        executors = [
+            concurrent.futures.ProcessPoolExecutor(
+                max_workers=stage.workers, mp_context=multiprocessing.get_context('spawn'),
+                initializer=stage.initializer, initargs=stage.initargs
+            ) if stage.kind == 'process' else None
+            for stage in self.stages
+        ]
+        threads = [threading.Thread(target=self._feed, args=(items,), daemon=True)]
+        for idx, stage in enumerate(self.stages):
+            workers = [
+                threading.Thread(target=self._work, args=(idx, executors[idx]), daemon=True)
+                for _ in range(stage.workers)
+            ]
+            threads += workers
+            threads.append(threading.Thread(target=self._close, args=(idx, workers), daemon=True))
+        for thread in threads:
+            thread.start()
+        try:
+            lastReport = time.time()
+            while True:
+                try:
+                    packet = self.queues[-1].get(timeout=self.reportInterval)
+                except queue.Empty:
+                    packet = None
+                if time.time() - lastReport >= self.reportInterval:
+                    print(self.status())
+                    lastReport = time.time()
+                if packet is Pipeline._DONE:
+                    break
+                if packet is not None:
+                    yield packet
+        finally:
+            # If the caller stopped early, let the remaining items drain through without doing any work
+            self.cancelled.set()
+            for thread in threads:
+                thread.join()
+            for executor in executors:
+                if executor:
+                    executor.shutdown()
+
+    def _feed(self, items):
+        for item in items:
+            self.queues[0].put((item, None))
+        for _ in range(self.stages[0].workers):
+            self.queues[0].put(Pipeline._DONE)
+
+    def _work(self, idx, executor):
+        stage = self.stages[idx]
+        inQueue, outQueue = self.queues[idx], self.queues[idx + 1]
+        while True:
+            stage.sampleDepth(inQueue.qsize())
+            packet = inQueue.get()
+            if packet is Pipeline._DONE:
+                return
+            item, error = packet
+            if error is None and not self.cancelled.is_set():
+                start = time.time()
+                try:
+                    item = executor.submit(stage.func, item).result() if executor else stage.func(item)
+                except Exception as e:
+                    error = (stage.name, e)
+                stage.record(start, time.time())
+            outQueue.put((item, error))
+
+    def _close(self, idx, workers):
+        """Once every worker of a stage has finished, passes end-of-input to the next stage (or the output)."""
+        for worker in workers:
+            worker.join()
+        nextWorkers = self.stages[idx + 1].workers if idx + 1 < len(self.stages) else 1
+        for _ in range(nextWorkers):
+            self.queues[idx + 1].put(Pipeline._DONE)
+
+    def status(self):
+        """Returns a one-line snapshot of items done and queue depth per stage."""
+        return ' | '.join(f"{stage.name}: {stage.count} done, {q.qsize()} queued" for stage, q in zip(self.stages, self.queues))
+
+    def report(self):
+        print("Pipeline stage report:")
+        for stage in self.stages:
+            print("  " + stage.summary())
+
+
 class YearParse:
     """An Object that obtains and stores one year's worth of DAR Objects"""
     
-    def __init__(self, year, yearUrl, outDir):
+    def __init__(self, year, yearUrl, outDir, cache=None, backend='jpype', workers=None, plumberKeys=(), downloadConcurrency=8,
+                 stageWorkers=None, queueSize=8, resume=True, keepArtifacts=False, urlIndex=None):
         self.year = year
         self.yearUrl = yearUrl
         self.outDir = outDir
-        self.urlList = Tools.urlList(yearUrl, self.year) # Pull the URLs from the DAR webpage
-        self.termTable = self.parseTermTable_sec1(self.urlList[0], outDir) # Parse the 1st TIF's Term Table
-        self.darList = []
+        self.cache = cache # Optional PdfCache shared by every DAR in this year
+        self.extractor = TabulaExtractor(backend) # Sent to each worker; the JVM itself lives in the worker process
+        self.workers = workers # Default pool size of the process stages (None uses os.cpu_count())
+        self.plumberKeys = tuple(plumberKeys) # TableRequest keys extracted with pdfplumber instead of tabula
+        self.downloadConcurrency = downloadConcurrency # Simultaneous PDF downloads
+        # Workers per Pipeline stage; stageWorkers overrides any of these
+        self.stageWorkers = {'download': downloadConcurrency, 'locate': workers, 'extract': workers, 'parse': 1}
+        self.stageWorkers.update({k: v for k, v in (stageWorkers or {}).items() if v})
+        self.queueSize = queueSize # Items allowed to wait between two stages
+        self.resume = resume # Skip reports the journal already records as successful
+        # Pull the URLs from the DAR webpage (through the UrlIndex when there is one)
+        self.urlList = urlIndex.urlList(yearUrl, self.year) if urlIndex else Tools.urlList(yearUrl, self.year)
+        self.termTable_df = self.parseTermTable_sec1(self.urlList[0], outDir) # Parse the 1st TIF's Term Table
+        self.termTable = TermTable(self.termTable_df) # Name -> (start_year, end_year), shared by every DAR's parse step
+        self.journalFp = os.path.join(outDir, f'{self.year}_journal.jsonl') # Append-only per-URL outcomes, in completion order
         self.dictList = []
+        self.keepArtifacts = keepArtifacts # Keep each full DAR (PDF, tables, DataFrames) for debugging instead of only its DarResult
+        self.artifacts = {} # url -> DAR, filled only when keepArtifacts
 
-    def buildCsvFromDicts(self, csvFp):
-        """Create a CSV file from a list of Dictionaries. Each row is one Dictionary."""
-
-        # Define the fieldnames in the desired order
-        fieldnames = [
-            "tif_name",
-            "tif_year",
-            "start_year",
-            "end_year",
-            "tif_number",
-            "property_tax_extraction",
-            "cumulative_property_tax_extraction",
-            "transfers_in",
-            "cumulative_transfers_in",
-            "expenses",
-            "fund_balance_end",
-            "transfers_out",
-            "distribution",
-            "admin_costs",
-            "finance_costs",
-            "bank"
-        ]
+    def buildCsvFromDicts(self, csvFp, dictList=None):
+        """Create a CSV file from a list of Dictionaries (self.dictList by default). Each row is one Dictionary."""
 
         # Write the data to the CSV file
         with open(csvFp, 'w', newline='') as csvfile:
             writer = csv.writer(csvfile)
             # Write the header row
-            writer.writerow(fieldnames)
+            writer.writerow(CSV_FIELDS)
             # Write the data rows
-            for dictionary in self.dictList:
-                row = [dictionary.get(key, "") for key in fieldnames]
+            for dictionary in (self.dictList if dictList is None else dictList):
+                row = [dictionary.get(key, "") for key in CSV_FIELDS]
                 writer.writerow(row)
             print("CSV File saved to: " + csvFp)
 
@@ -262,13 +1006,72 @@ class YearParse:
         # else:
         #     print('Unable to save CSV: No data found in dictList')
     
+    def journalResult(self, journalFile, result, error=None):
+        """Appends one report's DarResult (outDict or failure reason, plus timings and diagnostics) to the journal and flushes it to disk."""
+        record = {'url': result.url, 'status': 'ok' if error is None else 'failed', 'timings': result.timings, 'time': time.time()}
+        if result.diagnostics:
+            record['diagnostics'] = result.diagnostics
+        if error is None:
+            record['outDict'] = result.outDict()
+        else:
+            stageName, e = error
+            record['stage'] = stageName
+            record['error_type'] = type(e).__name__
+            record['error'] = str(e)
+            # Includes the worker's traceback for errors raised in a process stage
+            record['traceback'] = ''.join(traceback.format_exception(type(e), e, e.__traceback__))
+        journalFile.write(json.dumps(record) + '\n')
+        journalFile.flush()
+        os.fsync(journalFile.fileno())
+
+    def writeFailuresManifest(self, manifestFp):
+        """Writes one CSV row per report whose latest journal record is a failure; returns the number of failures."""
+        failures = [record for record in self.loadJournal().values() if record['status'] == 'failed']
+        fieldnames = ['url', 'tif_number', 'stage', 'error_type', 'error']
+        with open(manifestFp, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            for record in failures:
+                # TIF number from the filename, e.g. T_052_KinzieAR21.pdf -> 52
+                match = re.search(r'T_(\d+)_', record['url'].split('/')[-1])
+                tifNumber = int(match.group(1)) if match else ''
+                writer.writerow([record['url'], tifNumber, record.get('stage', ''), record.get('error_type', ''), record.get('error', '')])
+        print(f"Failures manifest ({len(failures)} failed) saved to: {manifestFp}")
+        return len(failures)
+
+    def loadJournal(self):
+        """Returns a Dictionary of url -> latest journal record, or an empty one if there is no journal yet."""
+        records = {}
+        if not os.path.exists(self.journalFp):
+            return records
+        with open(self.journalFp, 'r') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue # A line cut short by a crash mid-write
+                records[record['url']] = record # A later record for the same URL wins
+        return records
+
+    def compactResults(self, csvFp):
+        """Writes the journal's successful records to the final CSV in webpage (urlList) order."""
+        records = {url: record for url, record in self.loadJournal().items() if record['status'] == 'ok'}
+        urlOrder = {url: idx for idx, url in enumerate(self.urlList)}
+        self.dictList = [records[url]['outDict'] for url in sorted(records, key=lambda url: urlOrder.get(url, len(urlOrder)))]
+        self.buildCsvFromDicts(csvFp)
+
     def parseTermTable_sec1(self, firstUrl, outDir):
         """Saves the Termination Table CSV to outDir"""
-        dfs = tabula.read_pdf(
-            input_path=firstUrl,
-            pages='1-4', # adjust dynamically based on year?
-            pandas_options={'header': None},
-        )
+        # On resume, reuse the Term Table saved by an earlier run instead of extracting it again
+        termTableFp = os.path.join(outDir, f"{self.year}_termTable.csv")
+        if self.resume and os.path.exists(termTableFp):
+            print(f"Reusing saved Term Table: {termTableFp}")
+            return pd.read_csv(termTableFp, dtype=str)
+        # Read the first PDF through the cache when there is one (tabula downloads the URL itself otherwise)
+        firstPdf = io.BytesIO(self.cache.get(firstUrl)) if self.cache else firstUrl
+        dfs = self.extractor.run(firstPdf, [
+            TableRequest('termTable', pages='1-4', pandas_options={'header': None}), # adjust pages dynamically based on year?
+        ])['termTable']
         # Drop first column from first page of the table (it is empty)
         dfs[0] = dfs[0].drop(0, axis=1)
         dfs[0].columns = dfs[0].columns = range(len(dfs[0].columns))
@@ -283,9 +1086,84 @@ class YearParse:
         print(df)
         return df
 
-    def setLocale(self):
-        # Set the locale for each process
-        locale.setlocale(locale.LC_NUMERIC, 'en_US.UTF-8')
+    # Read-only state installed once per pool worker by initWorker(): step name -> extra arguments for that DAR step
+    workerState = {}
+
+    def initWorker(state, warmPdf):
+        """Pool initializer: installs the shared step arguments and boots a warm JVM that the worker keeps for every report."""
+        YearParse.workerState.update(state)
+        if warmPdf and 'extract' in state:
+            state['extract'][0].warm(warmPdf)
+
+    def workerStep(step, dar):
+        """Runs one DAR step in a pool worker with the arguments initWorker() installed, so only the DAR crosses processes."""
+        getattr(dar, step)(*YearParse.workerState.get(step, ()))
+        if step == 'extract':
+            dar.release()
+        return dar
+
+    def parseStep(termTables, keepArtifacts, dar):
+        """Parse stage: parses the report against its year's TermTable and reduces it to its DarResult, so the year holds kilobytes rather than every PDF."""
+        return dar.parse(termTables[dar.year]).result(keepArtifacts)
+
+    def buildPipeline(self, termTables):
+        """Returns the download -> locate -> extract -> parse Pipeline; termTables maps each year it will see to its TermTable."""
+        # * Process stages are spawned (the Windows default everywhere) because the parent's in-process JVM cannot survive a fork
+        # Warm each extraction worker's JVM on the term table PDF; a resumed run may have reused the saved Term Table
+        # without fetching it, so make sure it is cached (a no-op when parseTermTable_sec1 just downloaded it)
+        warmPdf = None
+        if self.cache:
+            try:
+                self.cache.get(self.urlList[0])
+                warmPdf = self.cache.path(self.urlList[0])
+            except (requests.RequestException, LookupError) as e:
+                print(f"Unable to fetch {self.urlList[0]} to warm the extraction workers (their JVMs will start on first use): {e}")
+        downloader = PdfDownloader(self.cache, concurrency=self.downloadConcurrency) if self.cache else None
+        return Pipeline([
+            Stage('download', methodcaller('download', self.cache, downloader), workers=self.stageWorkers['download']),
+            Stage('locate', partial(YearParse.workerStep, 'locate'), workers=self.stageWorkers['locate'], kind='process',
+                  initializer=YearParse.initWorker, initargs=({'locate': (self.plumberKeys,)}, None)),
+            Stage('extract', partial(YearParse.workerStep, 'extract'), workers=self.stageWorkers['extract'], kind='process',
+                  initializer=YearParse.initWorker, initargs=({'extract': (self.extractor,)}, warmPdf)),
+            Stage('parse', partial(YearParse.parseStep, termTables, self.keepArtifacts), workers=self.stageWorkers['parse']),
+        ], queueSize=self.queueSize)
+
+    def pendingDars(self):
+        """Returns a deferred DAR for every report the journal does not already record as parsed."""
+        # Resume from the journal: only reports without a successful record are parsed again
+        done = {url for url, record in self.loadJournal().items() if record['status'] == 'ok'} if self.resume else set()
+        todoList = [url for url in self.urlList if url not in done]
+        print(f"{self.year} journal: {len(done)} report(s) already parsed, {len(todoList)} to parse")
+        return [DAR(self.year, url, None, deferred=True) for url in todoList]
+
+    def recordResult(self, journalFile, item, error):
+        """Journals one report that came out of the Pipeline and prints its outDict (or why it failed)."""
+        # A failed report comes out as the DAR its stage was given; reduce it to a DarResult too
+        result = item.result(self.keepArtifacts) if error else item
+        self.journalResult(journalFile, result, error)
+        if result.artifacts:
+            self.artifacts[result.url] = result.artifacts
+        if error:
+            # One bad PDF is recorded and skipped; the rest of the year keeps flowing through the pipeline
+            stageName, e = error
+            print(f"FAILED ON: {result.url} ({stageName} stage): {type(e).__name__}: {e}")
+            return
+        print(json.dumps(result.outDict(), indent=4))
+
+    def finish(self, isFail=False):
+        """After the Pipeline drains, compacts the journaled results into an ordered (possibly partial) CSV and failures manifest.
+
+        Returns the number of reports missing from the CSV, or None if the run failed and no CSV was written.
+        """
+        self.termTable.missReport()
+        if isFail:
+            print(f"Results completed before the failure are journaled in {self.journalFp}; re-run to resume")
+            return None
+        self.compactResults(os.path.join(self.outDir, f'{self.year}_out.csv')) # TODO: command line arg for output directory?
+        failureCount = self.writeFailuresManifest(os.path.join(self.outDir, f'{self.year}_failures.csv'))
+        if failureCount:
+            print(f"WARNING: {self.year}_out.csv is missing {failureCount} report(s); fix and re-run to parse only those")
+        return failureCount
 
     def run(self):
         startTime = time.time()
@@ -324,82 +1202,168 @@ class YearParse:
         #         self.dictList.append(dar.outDict)
         #         print(json.dumps(dar.outDict, indent=4))
 
-        # ! - OPTION #3: With Multiprocessing (Fastest)
+        # ! - OPTION #3: With Multiprocessing (Fast) - replaced by OPTION #4, see git history
+
+        # ! - OPTION #4: Staged Pipeline (Fastest)
+        # Download, page indexing, tabula extraction and parsing each get their own workers, connected by bounded
+        # queues, so network I/O, PDF text parsing and table extraction for different reports overlap
         isFail = False
+        pipeline = self.buildPipeline({self.year: self.termTable})
         try:
-            # Create a multiprocessing Pool
-            pool = multiprocessing.Pool(initializer=self.setLocale, initargs=())
-            # Apply DAR to each URL in parallel
-            results = []
-            for url in self.urlList:
-                result = pool.apply_async(DAR, args=(self.year, url, self.termTable))
-                results.append(result)
-            # Wait for the results and collect DAR objects
-            for result in results:
-                dar = result.get()
-                self.darList.append(dar)
-                self.dictList.append(dar.outDict)
-                print(json.dumps(dar.outDict, indent=4))
-            # Close the multiprocessing Pool
-            pool.close()
-            pool.join()
+            # Journal each outcome as it completes, so a crash keeps every report finished before it
+            with open(self.journalFp, 'a' if self.resume else 'w') as journalFile:
+                for item, error in pipeline.run(self.pendingDars()):
+                    self.recordResult(journalFile, item, error)
         except Exception as e:
             # Handle keyboard interrupt (Ctrl+C)
             print(f"Program failed, error occured: {e=}")
             traceback.print_exc()
-            pool.terminate()
-            pool.join()
             # Perform any necessary cleanup or finalization steps
             isFail = True
-            
-        # # After one year is parsed, store output in a CSV
-        if not isFail:
-            self.buildCsvFromDicts(os.path.join(self.outDir, f'{self.year}_out.csv')) # TODO: command line arg for output directory?
+        pipeline.report()
+        # Keep the PDF cache within its size bound
+        if self.cache:
+            self.cache.evict()
+        failureCount = self.finish(isFail)
         # Print the runtime in minutes:seconds format
         endTime = time.time()
         runtime_seconds = endTime - startTime
         runtime_minutes = runtime_seconds // 60
         runtime_seconds %= 60
         print(f"Program runtime: {int(runtime_minutes)} minutes {int(runtime_seconds)} seconds")
+        return failureCount
+
+
+class Backfill:
+    """Parses a range of years as one job list through a single Pipeline, with a shared PDF cache.
+
+    Each year's page and Term Table are fetched concurrently up front; after that every (year, URL) report flows
+    through the same stage pools, so workers never sit idle at a year boundary. Each year still gets its own
+    journal, CSV and failures manifest, and the years are finally combined into one CSV.
+    """
+
+    def __init__(self, yearUrls, csvRoot, cache=None, **yearOptions):
+        self.csvRoot = csvRoot
+        self.cache = cache
+        # Fetch each year's URL list and Term Table at the same time
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(yearUrls) or 1) as executor:
+            futures = {
+                year: executor.submit(YearParse, year, yearUrl, Backfill.yearDir(csvRoot, year), cache, **yearOptions)
+                for year, yearUrl in yearUrls.items()
+            }
+        self.yearParses = []
+        for year, future in futures.items():
+            try:
+                self.yearParses.append(future.result())
+            except Exception as e:
+                print(f"SKIPPING {year}: unable to read its report list or Term Table: {type(e).__name__}: {e}")
+        # Reports are matched back to their year by URL
+        self.urlYearParse = {url: yp for yp in self.yearParses for url in yp.urlList}
+        self.failureCount = None  # Reports missing from the combined CSV, set by run()
+
+    def yearDir(csvRoot, year):
+        """Returns (and creates) the output directory of one year."""
+        outDir = os.path.join(csvRoot, str(year))
+        if not os.path.exists(outDir):
+            os.makedirs(outDir)
+        return outDir
+
+    def run(self):
+        """Parses every pending report of every year, then writes each year's CSV and the combined CSV; returns its path.
+
+        self.failureCount holds the number of reports missing from the combined CSV afterwards.
+        """
+        startTime = time.time()
+        years = [yp.year for yp in self.yearParses]
+        if not years:
+            print("Nothing to backfill")
+            return None
+        isFail = False
+        pipeline = self.yearParses[0].buildPipeline({yp.year: yp.termTable for yp in self.yearParses})
+        try:
+            with contextlib.ExitStack() as stack:
+                journalFiles = {yp.year: stack.enter_context(open(yp.journalFp, 'a' if yp.resume else 'w')) for yp in self.yearParses}
+                items = (dar for yp in self.yearParses for dar in yp.pendingDars())
+                for item, error in pipeline.run(items):
+                    yp = self.urlYearParse[item.url if isinstance(item, DarResult) else item.pdfUrl]
+                    yp.recordResult(journalFiles[yp.year], item, error)
+        except Exception as e:
+            print(f"Backfill failed, error occured: {e=}")
+            traceback.print_exc()
+            isFail = True
+        pipeline.report()
+        if self.cache:
+            self.cache.evict()
+        failureCounts = [yp.finish(isFail) for yp in self.yearParses]
+        csvFp = None
+        if not isFail:
+            self.failureCount = sum(failureCounts)
+            # One dataset for the whole history, year by year in webpage order
+            csvFp = os.path.join(self.csvRoot, f'{years[0]}-{years[-1]}_out.csv')
+            self.yearParses[0].buildCsvFromDicts(csvFp, [row for yp in self.yearParses for row in yp.dictList])
+        runtime_minutes, runtime_seconds = divmod(time.time() - startTime, 60)
+        print(f"Backfill of {len(years)} years runtime: {int(runtime_minutes)} minutes {int(runtime_seconds)} seconds")
+        return csvFp
+
+
+# The CSV columns of a parsed report, in output order
+CSV_FIELDS = [
+    "tif_name",
+    "tif_year",
+    "start_year",
+    "end_year",
+    "tif_number",
+    "property_tax_extraction",
+    "cumulative_property_tax_extraction",
+    "transfers_in",
+    "cumulative_transfers_in",
+    "expenses",
+    "fund_balance_end",
+    "transfers_out",
+    "distribution",
+    "admin_costs",
+    "finance_costs",
+    "bank"
+]
+
+
+class DarResult(namedtuple('DarResult', ['url'] + CSV_FIELDS + ['timings', 'diagnostics', 'artifacts'])):
+    """What a year keeps of one report: its CSV fields ("" if not parsed), step timings and diagnostics.
+
+    artifacts is the full DAR (PDF, extracted tables and DataFrames) when YearParse was asked to keep it, else None.
+    """
+
+    __slots__ = ()
+
+    def outDict(self):
+        """Returns the CSV fields as the Dictionary DAR.outDict held."""
+        return {field: getattr(self, field) for field in CSV_FIELDS}
 
 
 class DAR:
     """Parses and stores data from a single TIF DAR PDF."""
 
-    def __init__(self, year, url, termTable_df):
-        """Initializes a DAR object."""
+    def __init__(self, year, url, termTable_df, cache=None, extractor=None, plumberKeys=(), deferred=False):
+        """Initializes a DAR object. With deferred=True the caller runs download(), locate(), extract() and parse() itself."""
 
         self.year = year
         self.pdfUrl = url
-        self.pdf = io.BytesIO(requests.get(url).content)
-        try:
-            self.sec31 = Tools.getPageNumFromText(self.pdf, 'SECTION 3.1')
-        except:
-            print("Tools.getPageNumFromText() ERROR on 'SECTION 3.1'")
-            print("ASSUMING PAGE 6...")
-            self.sec31 = 6
-        try:
-            self.sec32a = Tools.getPageNumFromText(self.pdf, 'ITEMIZED LIST OF ALL EXPENDITURES FROM THE SPECIAL TAX ALLOCATION FUND')
-        except:
-            print("Tools.getPageNumFromText() ERROR on 'ITEMIZED LIST OF ALL EXPENDITURES FROM THE SPECIAL TAX ALLOCATION FUND'")
-            print("ASSUMING PAGE 8...")
-            self.sec32a = 8
-        try:
-            self.sec32b = Tools.getPageNumFromText(self.pdf, "Section 3.2 B")
-        except:
-            print("Tools.getPageNumFromText() ERROR on 'Section 3.2 B'")
-            print("ASSUMING PAGE 11...")
-            self.sec32a = 8
+        self.pdf = None # A cached file path, or BytesIO when there is no cache
+        self.layout = None # Shared pdfplumber document for every coordinate lookup (only open during locate())
+        self.tableRequestList = []
+        self.tables = {}
+        self.timings = {}
         self.sec31_df = None
         self.sec32b_df = None
         self.startYear = -1
         self.endYear = -1
         self.outDict = {}
-        # CAN WE CONVERT THESE 4 LINES INTO ASYNC?
-        self.setIdNameYear_sec31() 
-        self.setStartEndDates(termTable_df)
-        self.sec31_df = self.parseData_sec31()
-        self.sec32b_df = self.parseAdminFinanceBank_sec32b()
+        self.diagnostics = {} # Parsing fallbacks taken (assumed section pages, Term Table miss, fuzzy row matches) for the DarResult
+        if not deferred:
+            self.download(cache)
+            self.locate(plumberKeys)
+            self.extract(extractor)
+            self.parse(termTable_df)
         # Create an event loop
         # loop = asyncio.get_event_loop()
         # # Run the async methods concurrently
@@ -414,21 +1378,166 @@ class DAR:
         # self.sec31_df = results[2]
         # self.sec32b_df = results[3]
 
-    def setStartEndDates(self, df):
-        """Sets outDict start and end years from the Term Table DataFrame"""
-        # Obtain the appropriate years from the DataFrame
+    # * The four steps below are the Pipeline stages of YearParse.run(); each returns self for the next stage
+
+    def download(self, cache=None, downloader=None):
+        """I/O step: fetches the PDF, through the cache (or a retrying PdfDownloader) when there is one."""
+        startTime = time.time()
+        if downloader:
+            downloader.fetch(self.pdfUrl)
+            self.pdf = downloader.cache.path(self.pdfUrl)
+        elif cache:
+            cache.get(self.pdfUrl)
+            self.pdf = cache.path(self.pdfUrl) # Later stages open the cached file, so PDF bytes never cross processes
+        else:
+            self.pdf = io.BytesIO(requests.get(self.pdfUrl).content)
+        self.timings['download'] = time.time() - startTime
+        return self
+
+    def locate(self, plumberKeys=()):
+        """Page-indexing step: finds section pages and word coordinates, and builds the extraction requests.
+
+        Keys in plumberKeys (e.g. 'sec31') are extracted here from pdfplumber word boxes, with no Java involved.
+        """
+        startTime = time.time()
+        self.locatePages()
+        self.layout = PdfLayout(self.pdf)
+        try:
+            self.tableRequestList = self.tableRequests()
+            plumberStartTime = time.time()
+            for request in [r for r in self.tableRequestList if r.key in plumberKeys]:
+                self.tables[request.key] = [self.layout.extractTable(request.pages, request.area, request.columns)]
+            # Timed on its own so pdfplumber extraction can be compared with tabula's 'extract' time
+            plumberTime = time.time() - plumberStartTime
+        finally:
+            # Release the pdfplumber document (and its page caches) before this object moves on
+            self.layout.close()
+            self.layout = None
+        if plumberKeys:
+            self.timings['plumber'] = plumberTime
+        self.timings['locate'] = time.time() - startTime - plumberTime
+        return self
+
+    def extract(self, extractor=None):
+        """Extraction step: runs every remaining tabula request for this PDF together; parsing steps read tables by key."""
+        startTime = time.time()
+        pending = [r for r in self.tableRequestList if r.key not in self.tables]
+        self.tables.update((extractor or TabulaExtractor()).run(self.pdf, pending))
+        self.timings['extract'] = time.time() - startTime
+        return self
+
+    def release(self):
+        """Drops the in-memory PDF once every table is extracted, so it is not sent back to the parent; a cached path is kept."""
+        if isinstance(self.pdf, io.BytesIO):
+            self.pdf = None
+        return self
+
+    def parse(self, termTable):
+        """Parse step: builds outDict from the extracted tables and the (preparsed) Term Table."""
+        startTime = time.time()
+        # CAN WE CONVERT THESE 4 LINES INTO ASYNC?
+        self.setIdNameYear_sec31() 
+        self.setStartEndDates(termTable)
+        self.sec31_df = self.parseData_sec31()
+        self.sec32b_df = self.parseAdminFinanceBank_sec32b()
+        self.timings['parse'] = time.time() - startTime
+        return self
+
+    def result(self, keepArtifacts=False):
+        """Returns this report as a compact DarResult; the DAR itself rides along only if keepArtifacts."""
+        return DarResult(
+            self.pdfUrl, *(self.outDict.get(field, "") for field in CSV_FIELDS),
+            timings=self.timings, diagnostics=self.diagnostics, artifacts=self if keepArtifacts else None
+        )
+
+    # Section 3.1 metrics: (outDict key, row label, 'cur'rent year or 'cum'ulative column, cast, default if the row is missing)
+    # A default of None means the row is required. Adding a metric here adds no extra scans of the table.
+    SEC31_FIELDS = [
+        ('property_tax_extraction', 'Property Tax Increment', 'cur', int, None),
+        ('cumulative_property_tax_extraction', 'Property Tax Increment', 'cum', int, None),
+        ('transfers_in', 'Transfers from Municipal Sources', 'cur', int, None),
+        ('cumulative_transfers_in', 'Transfers from Municipal Sources', 'cum', int, None),
+        ('expenses', 'Total Expenditures/Cash Disbursements (Carried forward from', 'cur', int, None),
+        ('fund_balance_end', 'FUND BALANCE, END OF REPORTING PERIOD*', 'cur', int, None),
+        ('transfers_out', 'Transfers to Municipal Sources', 'cur', float, 0.0),
+        ('distribution', 'Distribution of Surplus', 'cur', int, None),
+    ]
+    SEC31_MATCHER = LabelMatcher([label for _, label, _, _, _ in SEC31_FIELDS])
+
+    # Section markers located in every DAR, with the page assumed when a marker cannot be found
+    SECTION_MARKERS = {
+        'sec31': ('SECTION 3.1', 6),
+        'sec32a': ('ITEMIZED LIST OF ALL EXPENDITURES FROM THE SPECIAL TAX ALLOCATION FUND', 8),
+        'sec32b': ('Section 3.2 B', 11),
+    }
+
+    def locatePages(self):
+        """Sets the page number of each section from a single pass over the PDF's page text."""
+        targets = [marker for marker, _ in DAR.SECTION_MARKERS.values()]
+        try:
+            pageNums = PageIndex(self.pdf).findAll(targets)
+        except Exception as e:
+            print(f"PageIndex ERROR: {e}")
+            pageNums = {}
+        for attr, (marker, defaultPage) in DAR.SECTION_MARKERS.items():
+            pageNum = pageNums.get(marker)
+            if pageNum is None:
+                print(f"Unable to locate '{marker}'")
+                print(f"ASSUMING PAGE {defaultPage}...")
+                pageNum = defaultPage
+                self.diagnostics.setdefault('assumed_pages', {})[attr] = defaultPage
+            setattr(self, attr, pageNum)
+
+    def tableRequests(self):
+        """Lists every tabula extraction this DAR needs, computed from the located pages and word coordinates."""
+        # ! TODO - change to use Property Tax Increment as the x1 point=more reliable
+        source_coords = self.layout.findWord(self.sec31, 'SOURCE')
+        top = source_coords['top']
+        fund_coords = self.layout.findWord(self.sec31, 'FUND')
+        bottom = fund_coords['bottom']
+        # cumuCol_coords = Tools.getTextCoords(self.pdf, self.sec31, 'Cumulative')
+        x1 = source_coords['x1']
+        return [
+            # Section 3.1 Header (usually Page 6), for the TIF name
+            TableRequest(
+                'sec31_header',
+                pages=self.sec31,
+                area=[50, 0, 97, 500], # [topY, leftX, bottomY, rightX]
+                pandas_options={'header': None},
+                silent=True # Suppress stderr output
+            ),
+            # Section 3.1 revenue/expenditure table
+            TableRequest(
+                'sec31',
+                pages=self.sec31, 
+                area=[top-25, 0, 600, bottom+3], # [topY, leftX, bottomY, rightX]
+                # ! area above should work for 2017 and beyond. if not, fix Tools.getTextCords() calls
+                # * MODIFY THIS - use PDF X-Change viewer to see coordinates on a test DAR in command line, adjust as needed
+                columns=[0, x1+192, x1+267, x1+339],
+                stream=True,
+                pandas_options={'header': None},
+            ),
+            # Section 3.2 B vendor table (usually Page 11)
+            TableRequest(
+                'sec32b',
+                pages=self.sec32b, 
+                area=[155, 0, 660, 600], # [topY, leftX, bottomY, rightX]
+                # columns=[],
+                # # Modified in 2024
+                # stream=True,
+                lattice=True 
+            ),
+        ]
+
+    def setStartEndDates(self, termTable):
+        """Sets outDict start and end years from the preparsed TermTable (a Term Table DataFrame is converted first)"""
+        if not isinstance(termTable, TermTable):
+            termTable = TermTable(termTable)
         tifName = self.outDict['tif_name']
         print(f'tifName: {tifName}')
-        # Set Column Names
-        nameCol = df.filter(like='Name of Redevelopment Project Area').columns.tolist()[0]
-        desigCol = df.filter(like='Date Designated').columns.tolist()[0]
-        termCol = df.filter(like='Date Terminated').columns.tolist()[0]
-        # Parse values
-        try:
-            print(df[df[nameCol] == tifName])
-            self.startYear = df[df[nameCol] == tifName].loc[:, df.columns.str.contains(desigCol, case=False)].values[0][0].split('/')[2]
-            self.endYear = df[df[nameCol] == tifName].loc[:, df.columns.str.contains(termCol, case=False)].values[0][0].split('/')[2]
-        except:
+        self.startYear, self.endYear = termTable.lookup(tifName, self.pdfUrl)
+        if self.startYear == -1:
+            self.diagnostics['term_table_miss'] = True
             print("FAILED ON: ", self.outDict['tif_name'])
             print("URL: ", self.pdfUrl)
 
@@ -455,13 +1564,7 @@ class DAR:
             tifNumber = int(filename_parts[1])
             self.outDict['tif_number'] = tifNumber
             
-            df = tabula.read_pdf(
-                input_path=self.pdf,
-                pages=self.sec31,
-                area=[50, 0, 97, 500],
-                pandas_options={'header': None},
-                silent=True
-            )[0]
+            df = self.tables['sec31_header'][0]
             
             tifName = str(df.iloc[2,0])
             self.outDict['tif_name'] = tifName
@@ -518,24 +1621,8 @@ class DAR:
         # else:
         #     print("ID number not found.")
         #     return None
-        # ! TODO - change to use Property Tax Increment as the x1 point=more reliable
-        source_coords = Tools.getTextCoords(self.pdf, self.sec31, 'SOURCE')
-        top = source_coords['top']
-        fund_coords = Tools.getTextCoords(self.pdf, self.sec31, 'FUND')
-        bottom = fund_coords['bottom']
-        # cumuCol_coords = Tools.getTextCoords(self.pdf, self.sec31, 'Cumulative')
-        x1 = source_coords['x1']
-        # *STEP 1: READ PDF INTO DATAFRAME
-        df = tabula.read_pdf(
-            input_path=self.pdf,
-            pages=self.sec31, 
-            area=[top-25, 0, 600, bottom+3], # [topY, leftX, bottomY, rightX]
-            # ! area above should work for 2017 and beyond. if not, fix Tools.getTextCords() calls
-            # * MODIFY THIS - use PDF X-Change viewer to see coordinates on a test DAR in command line, adjust as needed
-            columns=[0, x1+192, x1+267, x1+339],
-            stream=True,
-            pandas_options={'header': None},
-        )[0]
+        # *STEP 1: READ PDF INTO DATAFRAME (extracted by tabula in DAR.tableRequests())
+        df = self.tables['sec31'][0]
         # *STEP 2: CLEAN DATAFRAME HEADER
         sourceColName = 'SOURCE of Revenue/Cash Receipts:'
         curYearColName = 'Revenue/Cash Receipts for Current Reporting Year'
@@ -557,55 +1644,23 @@ class DAR:
             print("FAILED ON: ", self.outDict['tif_name'])
             print("URL: ", self.pdfUrl)
         # *STEP 3: PARSE CLEANED DATAFRAME INTO DICTIONARY
-        # Obtain the Pandas series for the 'Property Tax Increment' Row
-        propTaxIncRow = df[df[sourceColName] == 'Property Tax Increment']
-        # Obtain the Current and Cumulative Strings out of the propTaxIncRow series
-        propTaxIncCur = propTaxIncRow[curYearColName].values[0]
-        propTaxIncCum = propTaxIncRow[cumColName].values[0]
-        # Use the user-defined Tools.stof() to clean the Strings to Integers for storage in self.outDict
-        self.outDict['property_tax_extraction'] = int(Tools.stof(propTaxIncCur))
-        self.outDict['cumulative_property_tax_extraction'] = int(Tools.stof(propTaxIncCum))
-
-        # Obtain the Pandas series for the 'Transfers from Municipal Sources' Row
-        transFromMunRow = df[df[sourceColName] == 'Transfers from Municipal Sources']
-        # Obtain the Current and Cumulative Strings out of the propTaxIncRow series
-        transFromMunCur = transFromMunRow[curYearColName].values[0]
-        transFromMunCum = transFromMunRow[cumColName].values[0]
-        # Use the user-defined Tools.stof() to clean the Strings to Integers for storage in self.outDict
-        self.outDict['transfers_in'] = int(Tools.stof(transFromMunCur))
-        self.outDict['cumulative_transfers_in'] = int(Tools.stof(transFromMunCum))
-
-        # Obtain the Pandas series for the 'Total Expenditures/Cash Disbursements' Row
-        totExpRow = df[df[sourceColName] == 'Total Expenditures/Cash Disbursements (Carried forward from']
-        # Obtain the value as a String
-        totExp = totExpRow[curYearColName].values[0]
-        # Use the user-defined Tools.stof() to clean the String to an Integer for storage in self.outDict
-        self.outDict['expenses'] = int(Tools.stof(totExp))
-
-        # Obtain the Pandas series for the 'FUND BALANCE, END OF REPORTING PERIOD*' Row
-        fundBalRow = df[df[sourceColName] == 'FUND BALANCE, END OF REPORTING PERIOD*']
-        # Obtain the value as a String
-        fundBal = fundBalRow[curYearColName].values[0]
-        # Use the user-defined Tools.stof() to clean the String to an Integer for storage in self.outDict
-        self.outDict['fund_balance_end'] = int(Tools.stof(fundBal))
-
-        # Obtain the Pandas series for the 'Transfers to Municipal Sources' Row
-        transToMunRow = df[df[sourceColName] == 'Transfers to Municipal Sources']
-        if not transToMunRow.empty:
-            # Obtain the value as a String
-            transToMun = transToMunRow['Revenue/Cash Receipts for Current Reporting Year'].values[0]
-            # Use the user-defined Tools.stof() to clean the String to an Integer for storage in self.outDict
-            self.outDict['transfers_out'] = Tools.stof(transToMun)
-        else:
-            # We cannot identify a 'Transfers to Municipal Sources' row, so value is 0.0
-            self.outDict['transfers_out'] = 0.0
-
-        # Obtain the Pandas series for the 'Distribution of Surplus' Row
-        distSurpRow = df[df[sourceColName] == 'Distribution of Surplus']
-        # Obtain the value as a String
-        distSurp = distSurpRow[curYearColName].values[0]
-        # Use the user-defined Tools.stof() to clean the String to an Integer for storage in self.outDict
-        self.outDict['distribution'] = int(Tools.stof(distSurp))
+        # Locate every metric's row in one pass over the SOURCE column, then read each value from its row
+        fuzzyHits = {}
+        rows = DAR.SEC31_MATCHER.index(df[sourceColName], fuzzyHits)
+        if fuzzyHits:
+            # Approximate label matches are kept with the result so they can be reviewed
+            self.diagnostics.setdefault('sec31_fuzzy_rows', {}).update(fuzzyHits)
+        colNames = {'cur': curYearColName, 'cum': cumColName}
+        for key, label, col, cast, default in DAR.SEC31_FIELDS:
+            pos = rows.get(label)
+            if pos is None:
+                if default is None:
+                    raise ValueError(f"Section 3.1 row '{label}' not found for {key}")
+                # e.g. We cannot identify a 'Transfers to Municipal Sources' row, so value is 0.0
+                self.outDict[key] = default
+                continue
+            # Use the user-defined Tools.stof() to clean the String for storage in self.outDict
+            self.outDict[key] = cast(Tools.stof(df[colNames[col]].iloc[pos]))
 
         # Return Section 3.1 DataFrame for Storage
         return df
@@ -641,30 +1696,22 @@ class DAR:
     def parseAdminFinanceBank_sec32b(self):
         """Obtains the Administration and Financing costs from Page 11 of a TIF DAR PDF."""
 
-        # Retrieve the Page 11 Table using Tabula
-        df = tabula.read_pdf(
-            input_path=self.pdf,
-            pages=self.sec32b, 
-            area=[155, 0, 660, 600], # [topY, leftX, bottomY, rightX]
-            # columns=[],
-            # # Modified in 2024
-            # stream=True,
-            lattice=True 
-        )[0]
+        # Retrieve the Page 11 Table extracted by Tabula
+        df = self.tables['sec32b'][0]
         # Ensure columns are as expected
         expected_cols = ['Service', 'Name', 'Amount']
         if not all(col in df.columns for col in expected_cols):
             print("ERROR: Unexpected columns in Section 3.2B dataframe")
         # Parse each Admin Cost and sum them; assume larger value is more accurate
         # adminCosts_service = df[df['Service'] == 'Administration']['Amount'].apply(Tools.stof).sum()
-        adminCosts_byName = df[df['Name'].astype(str).str.contains('City Program Management Cost|City Staff Cost', case=False, na=False)]['Amount'].apply(Tools.stof).sum()
+        adminCosts_byName = Tools.sumMoney(df[df['Name'].astype(str).str.contains('City Program Management Cost|City Staff Cost', case=False, na=False)]['Amount'])
         # adminCosts = max(adminCosts_service, adminCosts_byName)
         # if adminCosts_service != adminCosts_byName:
         #     print('\nAdmin Cost Discrepancy! Larger value chosen between', adminCosts_service, 'and', adminCosts_byName)
         #     print(f"Chosen Admin Value for TIF #{self.outDict['tif_number']}: {adminCosts}\n")
         # TODO: rely on the names, not service administration --- done?
         # Parse each Finance Cost Amount and sum them
-        financeCosts = df[df['Service'].astype(str).str.contains('financ', case=False, na=False)]['Amount'].apply(Tools.stof).sum()
+        financeCosts = Tools.sumMoney(df[df['Service'].astype(str).str.contains('financ', case=False, na=False)]['Amount'])
         bankNameList = (
             df[df['Service'].astype(str).str.contains('financ', case=False, na=False)]['Name']
             .drop_duplicates()
@@ -688,26 +1735,71 @@ class DAR:
 
 def main():
     # Use cmd line arg for year
-    if len(sys.argv) < 2:
-        print('BAD USAGE\nUsage: py tifParse.py [year]')
-        return
-    year = sys.argv[1]
-    # * MODIFY THIS: Filepath to write finalDict data to for each url
-    outDir = f'C:\\Users\\w\\clonedGitRepos\\chi-tif-parser\\csvs\\{year}'
-    if not os.path.exists(outDir):
-        os.makedirs(outDir)
+    parser = argparse.ArgumentParser(description='Parse one year (or a range of years) of Chicago TIF District Annual Reports into a CSV.')
+    parser.add_argument('year', help='Report year to parse, e.g. 2024, or a range of years to backfill into one CSV, e.g. 2010-2024')
+    parser.add_argument('--cache-dir', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pdf_cache'),
+                        help='Directory for the persistent PDF cache')
+    parser.add_argument('--cache-size-mb', type=int, default=2048, help='Evict least recently used PDFs beyond this size')
+    parser.add_argument('--offline', action='store_true', help='Serve PDFs and report URLs only from the caches; never download them')
+    parser.add_argument('--url-index', default=UrlIndex.DEFAULT_FP, help='JSON file indexing the report URLs of each year webpage')
+    parser.add_argument('--url-index-ttl-hours', type=float, default=24,
+                        help='Hours an indexed webpage is used before it is revalidated with chicago.gov')
+    parser.add_argument('--backend', choices=TabulaExtractor.BACKENDS, default='jpype',
+                        help='tabula backend: a long-lived in-process JVM per worker (jpype) or one java process per table (subprocess)')
+    parser.add_argument('--workers', type=int, default=None, help='Default processes per CPU-bound stage; extraction workers each hold a warm JVM (default: CPU count)')
+    parser.add_argument('--download-concurrency', type=int, default=8, help='Workers in the download stage (simultaneous PDF downloads)')
+    parser.add_argument('--locate-workers', type=int, default=None, help='Processes in the page-indexing stage (default: --workers)')
+    parser.add_argument('--extract-workers', type=int, default=None, help='Processes in the tabula extraction stage (default: --workers)')
+    parser.add_argument('--parse-workers', type=int, default=None, help='Threads in the parse stage (default: 1)')
+    parser.add_argument('--queue-size', type=int, default=8, help='Reports allowed to wait between two pipeline stages')
+    parser.add_argument('--fresh', action='store_true',
+                        help='Ignore the journal and saved Term Table from earlier runs and parse every report again')
+    parser.add_argument('--sec31-extractor', choices=['tabula', 'plumber'], default='tabula',
+                        help='Extract the Section 3.1 table with tabula or directly from pdfplumber word boxes (no Java)')
+    parser.add_argument('--keep-artifacts', action='store_true',
+                        help='Keep every report\'s PDF and extracted tables in memory for debugging (uses far more memory)')
+    args = parser.parse_args()
+    year = args.year
+    # * MODIFY THIS: Directory holding each year's output folder
+    csvRoot = 'C:\\Users\\w\\clonedGitRepos\\chi-tif-parser\\csvs'
 
     # * DAR URLs to Parse
-    darYearsUrls = Tools.darYearsUrls()
-    try:
-        url = darYearsUrls[year]
-    except KeyError as e:
-        print(f'{e=}')
-        print(f'No URL found for {year}')
-        sys.exit(1)
+    urlIndex = UrlIndex(args.url_index, maxAge=args.url_index_ttl_hours * 60 * 60, offline=args.offline)
+    darYearsUrls = urlIndex.darYearsUrls()
+    yearRange = re.fullmatch(r'(\d{4})-(\d{4})', year)
+    years = [str(y) for y in range(int(yearRange.group(1)), int(yearRange.group(2)) + 1)] if yearRange else [year]
+    missing = [y for y in years if y not in darYearsUrls]
+    if missing:
+        print(f'No URL found for {", ".join(missing)}')
+        if not yearRange:
+            sys.exit(1)
     # ! Confirm this works properly
-    yp = YearParse(year, url, outDir)
-    yp.run()
+    cache = PdfCache(args.cache_dir, maxBytes=args.cache_size_mb * 1024**2, offline=args.offline)
+    plumberKeys = ['sec31'] if args.sec31_extractor == 'plumber' else []
+    yearOptions = dict(backend=args.backend, workers=args.workers, plumberKeys=plumberKeys,
+                       downloadConcurrency=args.download_concurrency, queueSize=args.queue_size,
+                       stageWorkers={'locate': args.locate_workers, 'extract': args.extract_workers, 'parse': args.parse_workers},
+                       resume=not args.fresh, keepArtifacts=args.keep_artifacts, urlIndex=urlIndex)
+    if yearRange:
+        # Backfill: every year's reports share one set of stage pools and the PDF cache
+        backfill = Backfill({y: darYearsUrls[y] for y in years if y in darYearsUrls}, csvRoot, cache, **yearOptions)
+        mergeFp = backfill.run()
+        if mergeFp is None:
+            sys.exit(1)
+        failureCount = backfill.failureCount
+    else:
+        outDir = Backfill.yearDir(csvRoot, year)
+        yp = YearParse(year, darYearsUrls[year], outDir, cache, **yearOptions)
+        failureCount = yp.run()
+        if failureCount is None:
+            sys.exit(1)
+        mergeFp = os.path.join(outDir, f'{year}_out.csv')
+
+    # A partial CSV must not reach the master: mergeNewYear would reject the complete one once the rest are re-parsed
+    if failureCount:
+        print(f"NOT offering to merge {mergeFp} into the master: it is missing {failureCount} report(s). "
+              f"Re-run to parse the failed reports, then merge the complete CSV.")
+        return
 
     # * Wait for Input before merging into master (added in 2025)
     # Helper Function
@@ -725,7 +1817,7 @@ def main():
     choice = get_merge_master_input()
     if choice == 'y':
         # Do merge
-        Tools.mergeNewYear(masterFp, os.path.join(outDir, f'{year}_out.csv'))
+        Tools.mergeNewYear(masterFp, mergeFp)
     else:
         # Skip merge
         pass
@@ -1,143 +1,93 @@
 import os
-import sys
 import time
-import re
 import json
+import hashlib
+import argparse
+from string import Template
 from collections import defaultdict
+import numpy as np
 import pandas as pd
-from chi_tif_parser import Tools
+from chi_tif_parser import UrlIndex
 
 # -------------------------------
 # Map TIFs to their Report URLs
 # -------------------------------
 
-def build_tif_reports_map():
-    """Build a dictionary mapping TIF numbers to {year: report_url}."""
-    year_urls = Tools.darYearsUrls()
+def build_tif_reports_map(url_index=None):
+    """Build a dictionary mapping TIF numbers to {year: report_url} from the (persisted) URL index."""
+    url_index = url_index or UrlIndex()
     tif_reports = defaultdict(dict)
-    for year, url in year_urls.items():
-        for pdf_link in Tools.urlList(url, year):
-            match = re.search(r'T_(\d+)_.*AR(\d{2})\.pdf', pdf_link)
-            if match:
-                tif_number, yr = match.groups()
-                yr_int = int(yr)
-                if yr_int >= 90:        # 1990–1999
-                    full_year = 1900 + yr_int
-                else:                   # 2000–2089
-                    full_year = 2000 + yr_int
-                tif_reports[tif_number][str(full_year)] = pdf_link
+    # Every year webpage is fetched (or revalidated) at once, so this takes as long as the slowest one
+    for year, reports in url_index.allReports().items():
+        for tif_number, pdf_link in reports:
+            tif_reports[tif_number][year] = pdf_link
     return tif_reports
 
 def generate_tif_data(args):
-    """Generate chart data for a single TIF."""
+    """Generate the columnar chart payload for a single TIF.
+
+    One shared year axis and one value array per metric; bar colors and chart titles are derived in the page.
+    """
     tif_name, tif_number, tif_df, data_columns, links = args
 
-    years = tif_df['tif_year'].astype(str).tolist()
-    
-    # Prepare chart data for each metric
-    charts_data = {}
+    charts_data = {'years': tif_df['tif_year'].tolist(), 'values': {}}
     for col in data_columns:
-        values = tif_df[col].fillna(0).tolist()
-        
-        # Color years with zero values differently
-        background_colors = []
-        border_colors = []
-        for v in values:
-            if v == 0:
-                background_colors.append('rgba(220, 53, 69, 0.6)')  # Red for zero
-                border_colors.append('rgba(220, 53, 69, 1)')
-            else:
-                background_colors.append('rgba(54, 162, 235, 0.6)')  # Blue for data
-                border_colors.append('rgba(54, 162, 235, 1)')
-        
-        # Finance Costs as Tooltip with Bank Name
-        extra = {}
+        values = tif_df[col].fillna(0).to_numpy()
+        # Whole-dollar columns are sent as integers (no trailing '.0' per value)
+        if values.dtype.kind == 'f' and np.all(np.mod(values, 1) == 0):
+            values = values.astype(np.int64)
+        charts_data['values'][col] = values.tolist()
+
+        # Finance Costs as Tooltip with Bank Name (only for years with finance costs)
         if col == "finance_costs" and "bank" in tif_df.columns:
-            bank_list = []
-            for v, b in zip(values, tif_df["bank"].fillna("").tolist()):
-                bank_list.append(b if v else "")
-            extra["bank"] = bank_list
-
-        charts_data[col] = {
-            'labels': years,
-            'values': values,
-            'background_colors': background_colors,
-            'border_colors': border_colors,
-            'title': col.replace('_', ' ').title(),
-            **extra
-        }
+            bank = np.where(values == 0, "", tif_df["bank"].fillna("").to_numpy(dtype=object))
+            if bank.any():
+                charts_data['bank'] = bank.tolist()
     
     return tif_name, tif_number, charts_data, links
 
-def create_tif_charts(file_path, current_report_year):
-    start_time = time.time()
-    df = pd.read_csv(file_path)
+# -------------------------------
+# Build Manifest
+# -------------------------------
 
-    out_dir = f"C:\\Users\\w\\clonedGitRepos\\chi-tif-parser\\charts"
-    os.makedirs(out_dir, exist_ok=True)
-    output_html = os.path.join(out_dir, f'{current_report_year}_tif_charts.html')
+# Bump when generate_tif_data's output changes, so every TIF is rebuilt once
+MANIFEST_VERSION = 1
 
-    data_columns = [
-        'property_tax_extraction',
-        'cumulative_property_tax_extraction', 
-        'transfers_in',
-        'cumulative_transfers_in',
-        'expenses',
-        'fund_balance_end',
-        'transfers_out',
-        'distribution',
-        'admin_costs',
-        'finance_costs'
-    ]
+def tif_inputs_hash(tif_name, tif_df, data_columns, links):
+    """Content hash of everything a TIF's chart payload is built from: its master rows, links and the metric list."""
+    h = hashlib.sha256()
+    h.update(json.dumps([MANIFEST_VERSION, tif_name, data_columns, dict(sorted(links.items()))]).encode('utf-8'))
+    h.update(tif_df.to_csv(index=False).encode('utf-8'))
+    return h.hexdigest()
 
-    tif_names = sorted(df['tif_name'].unique())
-    print(f"Processing {len(tif_names)} TIFs in alphabetical order.")
+def load_manifest(manifest_path):
+    """Return {tif_number: {'hash', 'charts'}} from the last build, or {} if there is none."""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
 
-    # Build TIF report links map
-    print("Building TIF report links map...")
-    tif_links_map = build_tif_reports_map()
-
-    # Process all TIFs (no multiprocessing needed since we're just processing data)
-    all_tif_data = []
-    toc_entries = []
-    
-    for i, tif_name in enumerate(tif_names):
-        tif_df = df[df['tif_name'] == tif_name].sort_values('tif_year')
-        tif_number = str(int(tif_df['tif_number'].iloc[0])).zfill(3)
-        links = tif_links_map.get(tif_number, {})
-        
-        # Removed queue parameter from the args tuple
-        _, _, charts_data, _ = generate_tif_data((tif_name, tif_number, tif_df, data_columns, links))
-        all_tif_data.append((tif_name, tif_number, charts_data, links))
-        toc_entries.append((tif_name, tif_number))
-        
-        if (i + 1) % 20 == 0:
-            print(f"Processed {i + 1}/{len(tif_names)} TIFs")
+# -------------------------------
+# Page Assets
+# -------------------------------
 
-    # Create HTML document
-    html_content = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>TIF Report Charts {current_report_year}</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js/dist/chart.umd.js"></script>
-    <style>
-        * {{
+# Stylesheet shared by the single-file report and the sharded site (written out as tif_charts.css)
+PAGE_CSS = '''        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             line-height: 1.6;
             color: #333;
             background-color: #f5f5f5;
-        }}
+        }
         
         /* Table of Contents Sidebar */
-        .toc-toggle {{
+        .toc-toggle {
             position: fixed;
             top: 20px;
             left: 20px;
@@ -152,14 +102,14 @@ def create_tif_charts(file_path, current_report_year):
             cursor: pointer;
             box-shadow: 0 4px 20px rgba(0,123,255,0.3);
             transition: all 0.3s ease;
-        }}
+        }
         
-        .toc-toggle:hover {{
+        .toc-toggle:hover {
             background: #0056b3;
             transform: scale(1.1);
-        }}
+        }
         
-        .toc-sidebar {{
+        .toc-sidebar {
             position: fixed;
             top: 0;
             left: -350px;
@@ -170,39 +120,39 @@ def create_tif_charts(file_path, current_report_year):
             z-index: 999;
             transition: left 0.3s ease;
             overflow-y: auto;
-        }}
+        }
         
-        .toc-sidebar.open {{
+        .toc-sidebar.open {
             left: 0;
-        }}
+        }
         
-        .toc-header {{
+        .toc-header {
             background: #007bff;
             color: white;
             padding: 1rem;
             font-size: 1.2rem;
             font-weight: 600;
-        }}
+        }
         
-        .toc-search {{
+        .toc-search {
             padding: 1rem;
             border-bottom: 1px solid #eee;
-        }}
+        }
         
-        .toc-search input {{
+        .toc-search input {
             width: 100%;
             padding: 0.5rem;
             border: 1px solid #ddd;
             border-radius: 5px;
             font-size: 14px;
-        }}
+        }
         
-        .toc-list {{
+        .toc-list {
             max-height: calc(100vh - 140px);
             overflow-y: auto;
-        }}
+        }
         
-        .toc-item {{
+        .toc-item {
             display: block;
             padding: 0.75rem 1rem;
             color: #333;
@@ -211,18 +161,18 @@ def create_tif_charts(file_path, current_report_year):
             transition: background 0.2s ease;
             font-size: 14px;
             line-height: 1.4;
-        }}
+        }
         
-        .toc-item:hover {{
+        .toc-item:hover {
             background: #f8f9fa;
             color: #007bff;
-        }}
+        }
         
-        .toc-item.hidden {{
+        .toc-item.hidden {
             display: none;
-        }}
+        }
         
-        .toc-overlay {{
+        .toc-overlay {
             position: fixed;
             top: 0;
             left: 0;
@@ -233,33 +183,33 @@ def create_tif_charts(file_path, current_report_year):
             opacity: 0;
             visibility: hidden;
             transition: all 0.3s ease;
-        }}
+        }
         
-        .toc-overlay.show {{
+        .toc-overlay.show {
             opacity: 1;
             visibility: visible;
-        }}
+        }
         
-        .header {{
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             height: auto; /* Ensure natural height */
             padding: 2rem;
             text-align: center;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             font-size: 2.5rem;
             margin-bottom: 0.5rem;
-        }}
+        }
         
-        .header p {{
+        .header p {
             font-size: 1.1rem;
             opacity: 0.9;
-        }}
+        }
         
-        .tif-page {{
+        .tif-page {
             background: white;
             margin: 2rem auto;
             max-width: 1400px;
@@ -267,9 +217,9 @@ def create_tif_charts(file_path, current_report_year):
             box-shadow: 0 4px 20px rgba(0,0,0,0.1);
             overflow: hidden;
             page-break-after: always;
-        }}
+        }
         
-        .tif-title {{
+        .tif-title {
             background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
             color: white;
             text-align: center;
@@ -277,16 +227,16 @@ def create_tif_charts(file_path, current_report_year):
             font-size: 1.5rem;
             font-weight: 600;
             margin: 0;
-        }}
+        }
         
-        .year-links {{
+        .year-links {
             background: #f8f9fa;
             padding: 1rem;
             text-align: center;
             border-bottom: 1px solid #e9ecef;
-        }}
+        }
         
-        .year-link {{
+        .year-link {
             display: inline-block;
             margin: 0.25rem 0.5rem;
             padding: 0.5rem 1rem;
@@ -298,140 +248,80 @@ def create_tif_charts(file_path, current_report_year):
             font-size: 0.9rem;
             transition: all 0.3s ease;
             box-shadow: 0 2px 5px rgba(0,123,255,0.3);
-        }}
+        }
         
-        .year-link:hover {{
+        .year-link:hover {
             background: #0056b3;
             transform: translateY(-2px);
             box-shadow: 0 4px 15px rgba(0,123,255,0.4);
-        }}
+        }
         
-        .charts-grid {{
+        .charts-grid {
             display: grid;
             grid-template-columns: repeat(2, 1fr);
             gap: 1.5rem;
             padding: 2rem;
-        }}
+        }
         
-        .chart-container {{
+        .chart-container {
             background: #f8f9fa;
             border-radius: 8px;
             padding: 1rem;
             box-shadow: 0 2px 5px rgba(0,0,0,0.05);
-        }}
+        }
         
-        .chart-title {{
+        .chart-title {
             text-align: center;
             margin-bottom: 1rem;
             font-weight: 600;
             color: #333;
             font-size: 1rem;
-        }}
+        }
         
-        .chart-canvas {{
+        .chart-canvas {
             max-height: 300px;
-        }}
+        }
         
-        .footer {{
+        .footer {
             text-align: center;
             padding: 2rem;
             color: #666;
             background: white;
             margin-top: 2rem;
-        }}
+        }
         
         /* Print styles */
-        @media print {{
-            .toc-toggle, .toc-sidebar, .toc-overlay {{ display: none !important; }}
-            body {{ background: white; }}
-            .tif-page {{ 
+        @media print {
+            .toc-toggle, .toc-sidebar, .toc-overlay { display: none !important; }
+            body { background: white; }
+            .tif-page { 
                 page-break-after: always; 
                 margin: 0;
                 box-shadow: none;
                 max-width: none;
-            }}
-        }}
+            }
+        }
         
         /* Mobile responsive */
-        @media (max-width: 768px) {{
-            .header h1 {{ font-size: 2rem; }}
-            .tif-page {{ margin: 1rem; }}
-            .charts-grid {{ 
+        @media (max-width: 768px) {
+            .header h1 { font-size: 2rem; }
+            .tif-page { margin: 1rem; }
+            .charts-grid { 
                 grid-template-columns: 1fr;
                 padding: 1rem;
-            }}
-            .toc-sidebar {{ width: 100vw; left: -100vw; }}
-            .toc-sidebar.open {{ left: 0; }}
-        }}
-    </style>
-</head>
-<body>
-    <!-- Table of Contents -->
-    <button class="toc-toggle" onclick="toggleTOC()">☰</button>
-    <div class="toc-overlay" onclick="closeTOC()"></div>
-    <div class="toc-sidebar">
-        <div class="toc-header">
-            TIF Directory ({len(tif_names)} Districts)
-        </div>
-        <div class="toc-search">
-            <input type="text" id="tocSearch" placeholder="Search TIF districts..." onkeyup="filterTOC()">
-        </div>
-        <div class="toc-list">'''
-
-    # Add TOC entries - simple anchor links
-    for tif_name, tif_number in toc_entries:
-        html_content += f'<a href="#tif-{tif_number}" class="toc-item">{tif_name}</a>'
-
-    html_content += f'''
-        </div>
-    </div>
-    
-    <div class="header">
-        <h1>Chicago Tax Increment Financing (TIF) Report Charts</h1>
-        <p>Year {current_report_year} • {len(tif_names)} TIF Districts</p>
-        <p style="font-size: 1.0rem; opacity: 0.8; margin-top: 0.5rem;">Blue year buttons link directly to PDF reports</p>
-    </div>
-    '''
+            }
+            .toc-sidebar { width: 100vw; left: -100vw; }
+            .toc-sidebar.open { left: 0; }
+        }
 
-    # Add all TIF sections
-    for tif_name, tif_number, charts_data, links in all_tif_data:
-        html_content += f'''
-    <div class="tif-page" id="tif-{tif_number}">
-        <h2 class="tif-title">{tif_name}</h2>
-        '''
-        
-        if links:
-            html_content += '<div class="year-links">'
-            for year, url in sorted(links.items()):
-                html_content += f'<a href="{url}" target="_blank" class="year-link">{year}</a>'
-            html_content += '</div>'
-        
-        html_content += '<div class="charts-grid">'
-        
-        # Add each chart
-        for col, chart_data in charts_data.items():
-            chart_id = f"chart_{tif_number}_{col}"
-            html_content += f'''
-            <div class="chart-container">
-                <div class="chart-title">{chart_data['title']}</div>
-                <canvas id="{chart_id}" class="chart-canvas"></canvas>
-            </div>
-            '''
-        
-        html_content += '</div></div>'
+        /* Sharded site: sections waiting on their shard keep roughly their final height, so TOC jumps land in place */
+        .tif-pending .tif-body {
+            min-height: 1400px;
+        }
+'''
 
-    # Add JavaScript for charts
-    html_content += '''
-    <div class="footer">
-        <p>Generated on ''' + time.strftime("%Y-%m-%d %H:%M:%S") + ''' • Total TIFs: ''' + str(len(tif_names)) + '''</p>
-        <p>Click year links to view detailed annual reports (opens in new tab) • Hover over charts for details</p>
-    </div>
-    
-    <script>
-        // Chart data
-        const chartData = ''' + json.dumps({f"{tif_number}": charts_data for _, tif_number, charts_data, _ in all_tif_data}) + ''';
-        
-        // TOC functions
+# TOC functions and the lazy Chart.js observer (written out as tif_charts.js); each page also defines chartData (TIF number -> payload)
+PAGE_JS = '''        // TOC functions
         function toggleTOC() {
             const sidebar = document.querySelector('.toc-sidebar');
             const overlay = document.querySelector('.toc-overlay');
@@ -463,6 +353,33 @@ def create_tif_charts(file_path, current_report_year):
             });
         }
         
+        // Bar colors and chart titles are derived here instead of being sent for every TIF and metric
+        const BAR_COLORS = {
+            zero: { background: 'rgba(220, 53, 69, 0.6)', border: 'rgba(220, 53, 69, 1)' },  // Red for zero
+            data: { background: 'rgba(54, 162, 235, 0.6)', border: 'rgba(54, 162, 235, 1)' }  // Blue for data
+        };
+
+        function metricTitle(metric) {
+            return metric.split('_').map(word => word.charAt(0).toUpperCase() + word.slice(1)).join(' ');
+        }
+
+        // Expand one metric of a TIF's columnar payload ({years, values: {metric: [...]}, bank}) into chart data
+        function chartPayload(tif, metric) {
+            const values = tif?.values[metric];
+            if (!values) {
+                return null;
+            }
+            const colors = values.map(v => v === 0 ? BAR_COLORS.zero : BAR_COLORS.data);
+            return {
+                labels: tif.years.map(String),
+                values: values,
+                background_colors: colors.map(color => color.background),
+                border_colors: colors.map(color => color.border),
+                title: metricTitle(metric),
+                bank: metric === 'finance_costs' ? tif.bank : undefined
+            };
+        }
+
         // Initialize charts as the user scrolls
         const chartInstances = {};  // Keep track of created charts
 
@@ -475,7 +392,7 @@ def create_tif_charts(file_path, current_report_year):
                     const metric = idParts.slice(2).join('_');    // join remaining parts for metric name
                     
                     if (!chartInstances[canvas.id]) {
-                        const data = chartData[tifNumber]?.[metric];
+                        const data = chartPayload(chartData[tifNumber], metric);
                         
                         if (!data) {
                             console.warn(`No chart data for ${canvas.id}`);
@@ -531,32 +448,371 @@ def create_tif_charts(file_path, current_report_year):
             });
         }, { rootMargin: '0px 0px 200px 0px' });  // preload slightly before viewport
 
-        document.querySelectorAll('.chart-canvas').forEach(canvas => {
-            observer.observe(canvas);
-        });
+        function observeCharts(root) {
+            root.querySelectorAll('.chart-canvas').forEach(canvas => {
+                observer.observe(canvas);
+            });
+        }
+'''
+
+# Sharded site only (written out as tif_site.js): lists TIFs from data/index.json, then fetches each TIF's shard as its section nears the viewport
+SHARD_JS = '''        const chartData = {};  // Filled one TIF at a time as shards arrive
+
+        // Build a TIF's section from its shard, with the same markup as the single-file report
+        function buildTifSection(section, tifNumber, shard) {
+            const body = section.querySelector('.tif-body');
+            const years = Object.keys(shard.links);
+            if (years.length) {
+                const yearLinks = document.createElement('div');
+                yearLinks.className = 'year-links';
+                years.forEach(year => {
+                    const link = document.createElement('a');
+                    link.href = shard.links[year];
+                    link.target = '_blank';
+                    link.className = 'year-link';
+                    link.textContent = year;
+                    yearLinks.appendChild(link);
+                });
+                body.appendChild(yearLinks);
+            }
+            const grid = document.createElement('div');
+            grid.className = 'charts-grid';
+            Object.keys(shard.charts.values).forEach(metric => {
+                const container = document.createElement('div');
+                container.className = 'chart-container';
+                const title = document.createElement('div');
+                title.className = 'chart-title';
+                title.textContent = metricTitle(metric);
+                const canvas = document.createElement('canvas');
+                canvas.id = `chart_${tifNumber}_${metric}`;
+                canvas.className = 'chart-canvas';
+                container.append(title, canvas);
+                grid.appendChild(container);
+            });
+            body.appendChild(grid);
+            section.classList.remove('tif-pending');
+        }
 
+        const shardObserver = new IntersectionObserver((entries, shardObserver) => {
+            entries.forEach(entry => {
+                if (!entry.isIntersecting) {
+                    return;
+                }
+                const section = entry.target;
+                const tifNumber = section.dataset.tif;
+                shardObserver.unobserve(section);  // Only fetch once
+                fetch(`data/tif_${tifNumber}.json`)
+                    .then(response => response.json())
+                    .then(shard => {
+                        chartData[tifNumber] = shard.charts;
+                        buildTifSection(section, tifNumber, shard);
+                        observeCharts(section);
+                    })
+                    .catch(error => console.warn(`Unable to load TIF ${tifNumber}: ${error}`));
+            });
+        }, { rootMargin: '0px 0px 800px 0px' });  // fetch a screen or so before the section scrolls in
 
-    </script>
+        // One TOC link and one empty section per TIF in the index
+        fetch('data/index.json')
+            .then(response => response.json())
+            .then(index => {
+                const tocList = document.querySelector('.toc-list');
+                const sections = document.getElementById('tif-sections');
+                index.tifs.forEach(([tifNumber, tifName]) => {
+                    const item = document.createElement('a');
+                    item.href = `#tif-${tifNumber}`;
+                    item.className = 'toc-item';
+                    item.textContent = tifName;
+                    tocList.appendChild(item);
+
+                    const section = document.createElement('div');
+                    section.className = 'tif-page tif-pending';
+                    section.id = `tif-${tifNumber}`;
+                    section.dataset.tif = tifNumber;
+                    const title = document.createElement('h2');
+                    title.className = 'tif-title';
+                    title.textContent = tifName;
+                    const body = document.createElement('div');
+                    body.className = 'tif-body';
+                    section.append(title, body);
+                    sections.appendChild(section);
+                    shardObserver.observe(section);
+                });
+                // Jump to a linked TIF now that its section exists
+                if (location.hash) {
+                    document.getElementById(location.hash.slice(1))?.scrollIntoView();
+                }
+            });
+'''
+
+# Page shell, shared by both outputs: everything before the TOC entries, between the TOC and the TIF
+# sections, and after the sections. Templates ($name placeholders) need no brace escaping.
+PAGE_HEAD = Template('''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>TIF Report Charts $year</title>
+    <script src="https://cdn.jsdelivr.net/npm/chart.js/dist/chart.umd.js"></script>
+    <link rel="stylesheet" href="$css_href">
+</head>
+<body>
+    <!-- Table of Contents -->
+    <button class="toc-toggle" onclick="toggleTOC()">☰</button>
+    <div class="toc-overlay" onclick="closeTOC()"></div>
+    <div class="toc-sidebar">
+        <div class="toc-header">
+            TIF Directory ($tif_count Districts)
+        </div>
+        <div class="toc-search">
+            <input type="text" id="tocSearch" placeholder="Search TIF districts..." onkeyup="filterTOC()">
+        </div>
+        <div class="toc-list">''')
+
+PAGE_HEADER = Template('''
+        </div>
+    </div>
+    
+    <div class="header">
+        <h1>Chicago Tax Increment Financing (TIF) Report Charts</h1>
+        <p>Year $year • $tif_count TIF Districts</p>
+        <p style="font-size: 1.0rem; opacity: 0.8; margin-top: 0.5rem;">Blue year buttons link directly to PDF reports</p>
+    </div>
+    ''')
+
+PAGE_FOOTER = Template('''
+    <div class="footer">
+        <p>Generated on $generated • Total TIFs: $tif_count</p>
+        <p>Click year links to view detailed annual reports (opens in new tab) • Hover over charts for details</p>
+    </div>
+    ''')
+
+PAGE_END = '''
 </body>
 </html>'''
 
-    # Write HTML file
-    with open(output_html, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+def write_json(path, data):
+    """Write compact JSON (no whitespace) to path."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, separators=(',', ':'))
+
+def write_asset(out_dir, name, content):
+    """Write a static asset (only if it changed) and return its href, versioned by content so browsers can cache it."""
+    path = os.path.join(out_dir, name)
+    data = content.encode('utf-8')
+    try:
+        with open(path, 'rb') as f:
+            unchanged = f.read() == data
+    except FileNotFoundError:
+        unchanged = False
+    if not unchanged:
+        with open(path, 'wb') as f:
+            f.write(data)
+    return f"{name}?v={hashlib.sha256(data).hexdigest()[:10]}"
+
+def write_page(path, chunks):
+    """Stream an iterable of HTML chunks to path through one buffered file, in a single pass."""
+    with open(path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+        f.writelines(chunks)
+
+def render_toc(toc_entries):
+    """Yield the TOC entries - simple anchor links."""
+    for tif_name, tif_number in toc_entries:
+        yield f'<a href="#tif-{tif_number}" class="toc-item">{tif_name}</a>'
+
+def render_tif_sections(all_tif_data):
+    """Yield the markup of every TIF section: title, year links and one canvas per chart."""
+    for tif_name, tif_number, charts_data, links in all_tif_data:
+        yield f'''
+    <div class="tif-page" id="tif-{tif_number}">
+        <h2 class="tif-title">{tif_name}</h2>
+        '''
+        
+        if links:
+            yield '<div class="year-links">'
+            for year, url in sorted(links.items()):
+                yield f'<a href="{url}" target="_blank" class="year-link">{year}</a>'
+            yield '</div>'
+        
+        yield '<div class="charts-grid">'
+        
+        # Add each chart
+        for col in charts_data['values']:
+            chart_id = f"chart_{tif_number}_{col}"
+            yield f'''
+            <div class="chart-container">
+                <div class="chart-title">{col.replace('_', ' ').title()}</div>
+                <canvas id="{chart_id}" class="chart-canvas"></canvas>
+            </div>
+            '''
+        
+        yield '</div></div>'
+
+def render_chart_data(all_tif_data):
+    """Yield the inline chartData script one TIF payload at a time."""
+    yield '''
+    <script>
+        // Chart data
+        const chartData = {'''
+    for i, (_, tif_number, charts_data, _) in enumerate(all_tif_data):
+        yield ('' if i == 0 else ',') + json.dumps(tif_number) + ':' + json.dumps(charts_data, separators=(',', ':'))
+    yield '''};
+    </script>'''
+
+def render_report(current_report_year, toc_entries, all_tif_data, css_href, js_href):
+    """Yield the single-file report: the shell templates around the TOC, TIF sections and chart data generators."""
+    shell = {'year': current_report_year, 'tif_count': len(toc_entries), 'css_href': css_href,
+             'generated': time.strftime("%Y-%m-%d %H:%M:%S")}
+    yield PAGE_HEAD.substitute(shell)
+    yield from render_toc(toc_entries)
+    yield PAGE_HEADER.substitute(shell)
+    yield from render_tif_sections(all_tif_data)
+    yield PAGE_FOOTER.substitute(shell)
+    yield from render_chart_data(all_tif_data)
+    yield f'''
+    <script src="{js_href}"></script>
+    <script>observeCharts(document);</script>'''
+    yield PAGE_END
+
+def render_site_shell(current_report_year, tif_count, css_href, js_href, site_js_href):
+    """Yield the sharded site's shell: empty TOC and sections, filled in by tif_site.js."""
+    shell = {'year': current_report_year, 'tif_count': tif_count, 'css_href': css_href,
+             'generated': time.strftime("%Y-%m-%d %H:%M:%S")}
+    yield PAGE_HEAD.substitute(shell)
+    yield PAGE_HEADER.substitute(shell)
+    yield '''
+    <div id="tif-sections"></div>
+    '''
+    yield PAGE_FOOTER.substitute(shell)
+    yield f'''
+    <script src="{js_href}"></script>
+    <script src="{site_js_href}"></script>'''
+    yield PAGE_END
+
+def write_chart_site(site_dir, current_report_year, all_tif_data, changed=None):
+    """Write the sharded chart site: an HTML shell with its assets, a compact TIF index and one small JSON shard per TIF.
+
+    The shell only fetches data/index.json up front; a TIF's shard is fetched, and its section built, as it
+    nears the viewport. Serve the folder over HTTP (e.g. GitHub Pages) since browsers block fetch() on file://.
+    Only shards of TIF numbers in changed (default: all) or missing on disk are rewritten; shards of TIFs no
+    longer in the data are removed.
+    """
+    data_dir = os.path.join(site_dir, 'data')
+    os.makedirs(data_dir, exist_ok=True)
+    shard_names = set()
+    for tif_name, tif_number, charts_data, links in all_tif_data:
+        shard_path = os.path.join(data_dir, f'tif_{tif_number}.json')
+        shard_names.add(os.path.basename(shard_path))
+        if changed is None or tif_number in changed or not os.path.exists(shard_path):
+            write_json(shard_path, {'links': dict(sorted(links.items())), 'charts': charts_data})
+    for name in os.listdir(data_dir):
+        if name.startswith('tif_') and name.endswith('.json') and name not in shard_names:
+            os.remove(os.path.join(data_dir, name))
+    write_json(os.path.join(data_dir, 'index.json'), {
+        'year': current_report_year,
+        'tifs': [[tif_number, tif_name] for tif_name, tif_number, _, _ in all_tif_data]
+    })
+
+    css_href = write_asset(site_dir, 'tif_charts.css', PAGE_CSS)
+    js_href = write_asset(site_dir, 'tif_charts.js', PAGE_JS)
+    site_js_href = write_asset(site_dir, 'tif_site.js', SHARD_JS)
+    output_html = os.path.join(site_dir, 'index.html')
+    write_page(output_html, render_site_shell(current_report_year, len(all_tif_data), css_href, js_href, site_js_href))
+    return output_html
+
+def create_tif_charts(file_path, current_report_year, sharded=False, full=False):
+    start_time = time.time()
+    df = pd.read_csv(file_path)
+
+    out_dir = f"C:\\Users\\w\\clonedGitRepos\\chi-tif-parser\\charts"
+    os.makedirs(out_dir, exist_ok=True)
+    output_html = os.path.join(out_dir, f'{current_report_year}_tif_charts.html')
+    site_dir = os.path.join(out_dir, f'{current_report_year}_tif_site')
+    # Each TIF's input hash and payload from the last build of this output; unchanged TIFs are reused, not rebuilt
+    manifest_path = (site_dir if sharded else output_html) + '.manifest.json'
+    manifest = {} if full else load_manifest(manifest_path)
+
+    data_columns = [
+        'property_tax_extraction',
+        'cumulative_property_tax_extraction', 
+        'transfers_in',
+        'cumulative_transfers_in',
+        'expenses',
+        'fund_balance_end',
+        'transfers_out',
+        'distribution',
+        'admin_costs',
+        'finance_costs'
+    ]
+
+    # One sort, then one groupby pass hands each TIF its rows already in year order (no per-TIF scan of the master)
+    df = df.sort_values(['tif_name', 'tif_year'], kind='mergesort')
+    tif_groups = df.groupby('tif_name', sort=True)
+    tif_names = list(tif_groups.groups)
+    print(f"Processing {len(tif_names)} TIFs in alphabetical order.")
+
+    # Build TIF report links map
+    print("Building TIF report links map...")
+    tif_links_map = build_tif_reports_map()
+
+    # Process all TIFs (no multiprocessing needed since we're just processing data)
+    all_tif_data = []
+    toc_entries = []
+    new_manifest = {}
+    changed = set()
+    
+    for i, (tif_name, tif_df) in enumerate(tif_groups):
+        tif_number = str(int(tif_df['tif_number'].iloc[0])).zfill(3)
+        links = tif_links_map.get(tif_number, {})
+        
+        inputs_hash = tif_inputs_hash(tif_name, tif_df, data_columns, links)
+        entry = manifest.get(tif_number)
+        if entry and entry['hash'] == inputs_hash:
+            charts_data = entry['charts']
+        else:
+            # Removed queue parameter from the args tuple
+            _, _, charts_data, _ = generate_tif_data((tif_name, tif_number, tif_df, data_columns, links))
+            changed.add(tif_number)
+        new_manifest[tif_number] = {'hash': inputs_hash, 'charts': charts_data}
+        all_tif_data.append((tif_name, tif_number, charts_data, links))
+        toc_entries.append((tif_name, tif_number))
+        
+        if (i + 1) % 20 == 0:
+            print(f"Processed {i + 1}/{len(tif_names)} TIFs")
+    print(f"Rebuilt {len(changed)} of {len(tif_names)} TIFs ({len(tif_names) - len(changed)} unchanged since the last build)")
+
+    if sharded:
+        output_html = write_chart_site(site_dir, current_report_year, all_tif_data, changed)
+        write_json(manifest_path, new_manifest)
+        elapsed = time.time() - start_time
+        print(f"\nTIF chart site ({len(changed)} of {len(all_tif_data)} shards rewritten) saved to {output_html}")
+        print(f"Total runtime: {int(elapsed)//60}m {int(elapsed)%60}s")
+        return
+
+    # Write the HTML file in one streamed pass; the stylesheet and script are shared, cacheable files beside it
+    css_href = write_asset(out_dir, 'tif_charts.css', PAGE_CSS)
+    js_href = write_asset(out_dir, 'tif_charts.js', PAGE_JS)
+    write_page(output_html, render_report(current_report_year, toc_entries, all_tif_data, css_href, js_href))
+    write_json(manifest_path, new_manifest)
 
     elapsed = time.time() - start_time
     print(f"\nAll TIF charts saved to {output_html}")
     print(f"Total runtime: {int(elapsed)//60}m {int(elapsed)%60}s")
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python create-tif-charts.py <year>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description='Build the TIF report charts from the master CSV.')
+    parser.add_argument('year', type=int, help='Current report year, e.g. 2024')
+    parser.add_argument('--sharded', action='store_true',
+                        help='Write a lazy-loading site (HTML shell, TIF index and one JSON shard per TIF) instead of one HTML file')
+    parser.add_argument('--full', action='store_true',
+                        help='Ignore the build manifest and rebuild every TIF')
+    args = parser.parse_args()
 
-    year_arg = int(sys.argv[1])
     create_tif_charts(
         r"C:\Users\w\clonedGitRepos\chi-tif-parser\csvs\chi-tif-data-master.csv",
-        year_arg
+        args.year,
+        sharded=args.sharded,
+        full=args.full
     )
 
 if __name__ == "__main__":